@@ -114,7 +114,7 @@ class SRECompanion:
                 Monitor.id.in_(affected_monitor_ids)
             ).all()
             for m in monitors:
-                config = json.loads(m.config_json) if m.config_json else {}
+                config = m.config
                 affected_monitors.append({
                     "id": m.id,
                     "type": m.monitor_type,
@@ -510,7 +510,7 @@ class SRECompanion:
                     for mid in affected_ids:
                         monitor = self.db.query(Monitor).filter(Monitor.id == mid).first()
                         if monitor:
-                            config = json.loads(monitor.config_json) if monitor.config_json else {}
+                            config = monitor.config
                             name = config.get("name", "")
                             monitor_names.append(f"{monitor.monitor_type}" + (f":{name}" if name else ""))
                     if monitor_names:
@@ -531,7 +531,7 @@ class SRECompanion:
                 if update.monitor:
                     monitor_type = update.monitor.monitor_type
                     try:
-                        config = json.loads(update.monitor.config_json) if update.monitor.config_json else {}
+                        config = update.monitor.config
                         monitor_name = config.get("name", "")
                         monitor_info = f"[{monitor_type}" + (f":{monitor_name}]" if monitor_name else "]")
                     except json.JSONDecodeError:
@@ -604,7 +604,7 @@ class SRECompanion:
                 for mid in affected_ids:
                     monitor = self.db.query(Monitor).filter(Monitor.id == mid).first()
                     if monitor:
-                        config = json.loads(monitor.config_json) if monitor.config_json else {}
+                        config = monitor.config
                         name = config.get("name", "")
                         monitor_names.append(f"{monitor.monitor_type}" + (f":{name}" if name else ""))
                 if monitor_names:
@@ -633,7 +633,7 @@ class SRECompanion:
             if update.monitor:
                 monitor_type = update.monitor.monitor_type
                 try:
-                    config = json.loads(update.monitor.config_json) if update.monitor.config_json else {}
+                    config = update.monitor.config
                     monitor_name = config.get("name", "")
                     monitor_info = f"[{monitor_type}" + (f":{monitor_name}]" if monitor_name else "]")
                 except json.JSONDecodeError:
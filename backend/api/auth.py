@@ -13,7 +13,7 @@ from utils.auth import (
     create_refresh_token,
     decode_refresh_token,
 )
-from utils.db import get_user_by_username, get_user_by_api_key
+from utils.db import get_user_by_username, api_key_exists
 from utils.audit import log_action
 
 router = APIRouter(prefix="/api/v1/auth", tags=["authentication"])
@@ -95,12 +95,10 @@ def refresh(request: RefreshRequest, db: Session = Depends(get_db)):
     return RefreshResponse(access_token=access_token, token_type="bearer")
 
 
-def get_user_from_api_key(api_key: str, db: Session) -> User:
-    """Get user from API key."""
-    user = get_user_by_api_key(db, api_key)
-    if not user:
+def verify_api_key(api_key: str, db: Session) -> None:
+    """Reject the request unless the API key belongs to a user."""
+    if not api_key_exists(db, api_key):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key"
         )
-    return user
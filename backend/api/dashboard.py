@@ -56,7 +56,7 @@ def get_all_status(
                     StatusUpdate.monitor_id == monitor.id
                 ).order_by(StatusUpdate.timestamp.desc()).first()
 
-                config = json.loads(monitor.config_json) if monitor.config_json else {}
+                config = monitor.config
 
                 if latest_status:
                     metadata = json.loads(latest_status.metadata_json) if latest_status.metadata_json else {}
@@ -43,7 +43,7 @@ def _enrich_incident(db: Session, incident) -> dict:
     for mid in affected_ids:
         monitor = db.query(Monitor).filter(Monitor.id == mid, Monitor.is_active == True).first()
         if monitor:
-            config = json.loads(monitor.config_json) if monitor.config_json else {}
+            config = monitor.config
             affected_monitors.append({
                 "id": monitor.id,
                 "type": monitor.monitor_type,
@@ -10,7 +10,7 @@ import json
 
 from database import get_db, Service, Monitor, StatusUpdate
 from models import HeartbeatRequest, MetricUpdateRequest, MetricUpdateResponse
-from api.auth import get_user_from_api_key
+from api.auth import verify_api_key
 from monitors import MONITOR_CLASSES, HEARTBEAT_MONITORS, METRIC_MONITORS
 from utils.service_helpers import notify_service_status_change
 
@@ -33,7 +33,7 @@ def receive_heartbeat(
     are required to identify which specific deadman monitor to update.
     """
     # Verify API key first before doing any DB work
-    get_user_from_api_key(heartbeat.api_key, db)
+    verify_api_key(heartbeat.api_key, db)
 
     # Find service by name
     service = db.query(Service).filter(
@@ -53,7 +53,7 @@ def receive_heartbeat(
 
     monitor = None
     for m in monitors:
-        config = json.loads(m.config_json)
+        config = m.config
         if config.get("name") == monitor_name:
             monitor = m
             break
@@ -112,7 +112,7 @@ def update_metric(
     Both service_name and monitor_name are required to identify the specific monitor.
     """
     # Verify API key first
-    get_user_from_api_key(request.api_key, db)
+    verify_api_key(request.api_key, db)
 
     # Find service by name
     service = db.query(Service).filter(
@@ -132,7 +132,7 @@ def update_metric(
 
     monitor = None
     for m in monitors:
-        config = json.loads(m.config_json)
+        config = m.config
         if config.get("name") == monitor_name:
             monitor = m
             break
@@ -53,7 +53,7 @@ def list_monitors(
             id=monitor.id,
             service_id=monitor.service_id,
             monitor_type=monitor.monitor_type,
-            config=json.loads(monitor.config_json),
+            config=monitor.config,
             check_interval_minutes=monitor.check_interval_minutes,
             is_active=monitor.is_active,
             last_check_at=monitor.last_check_at,
@@ -92,7 +92,7 @@ def create_monitor(
     db.commit()
     db.refresh(new_monitor)
 
-    config = json.loads(new_monitor.config_json)
+    config = new_monitor.config
     monitor_name = config.get("name") or config.get("url") or config.get("host") or monitor.monitor_type
     log_action(db, user=current_user, action="monitor.create", resource_type="monitor",
                resource_id=new_monitor.id, resource_name=monitor_name,
@@ -103,7 +103,7 @@ def create_monitor(
         id=new_monitor.id,
         service_id=new_monitor.service_id,
         monitor_type=new_monitor.monitor_type,
-        config=json.loads(new_monitor.config_json),
+        config=new_monitor.config,
         check_interval_minutes=new_monitor.check_interval_minutes,
         is_active=new_monitor.is_active,
         last_check_at=new_monitor.last_check_at,
@@ -127,7 +127,7 @@ def get_monitor(
         id=monitor.id,
         service_id=monitor.service_id,
         monitor_type=monitor.monitor_type,
-        config=json.loads(monitor.config_json),
+        config=monitor.config,
         check_interval_minutes=monitor.check_interval_minutes,
         is_active=monitor.is_active,
         last_check_at=monitor.last_check_at,
@@ -159,7 +159,7 @@ def update_monitor(
     db.commit()
     db.refresh(monitor)
 
-    config = json.loads(monitor.config_json)
+    config = monitor.config
     monitor_name = config.get("name") or config.get("url") or config.get("host") or monitor.monitor_type
     log_action(db, user=current_user, action="monitor.update", resource_type="monitor",
                resource_id=monitor.id, resource_name=monitor_name,
@@ -169,7 +169,7 @@ def update_monitor(
         id=monitor.id,
         service_id=monitor.service_id,
         monitor_type=monitor.monitor_type,
-        config=json.loads(monitor.config_json),
+        config=monitor.config,
         check_interval_minutes=monitor.check_interval_minutes,
         is_active=monitor.is_active,
         last_check_at=monitor.last_check_at,
@@ -191,7 +191,7 @@ def delete_monitor(
         raise HTTPException(status_code=404, detail="Monitor not found")
 
     service_id = monitor.service_id
-    config = json.loads(monitor.config_json) if monitor.config_json else {}
+    config = monitor.config
     monitor_name = config.get("name") or config.get("url") or config.get("host") or monitor.monitor_type
 
     # CASCADE delete will remove all status_updates
@@ -237,7 +237,7 @@ def pause_monitor(
     monitor.is_active = False
     db.commit()
 
-    config = json.loads(monitor.config_json) if monitor.config_json else {}
+    config = monitor.config
     monitor_name = config.get("name") or config.get("url") or config.get("host") or monitor.monitor_type
     log_action(db, user=current_user, action="monitor.pause", resource_type="monitor",
                resource_id=monitor_id, resource_name=monitor_name,
@@ -278,7 +278,7 @@ def resume_monitor(
     monitor.is_active = True
     db.commit()
 
-    config = json.loads(monitor.config_json) if monitor.config_json else {}
+    config = monitor.config
     monitor_name = config.get("name") or config.get("url") or config.get("host") or monitor.monitor_type
     log_action(db, user=current_user, action="monitor.resume", resource_type="monitor",
                resource_id=monitor_id, resource_name=monitor_name,
@@ -332,7 +332,7 @@ def check_monitor_now(
 
     status, response_time_ms, metadata = persist_monitor_check(db, monitor, result)
 
-    config_data = json.loads(monitor.config_json) if monitor.config_json else {}
+    config_data = monitor.config
     monitor_name = config_data.get("name") or config_data.get("url") or config_data.get("host") or monitor.monitor_type
     log_action(db, user=current_user, action="monitor.check_now", resource_type="monitor",
                resource_id=monitor_id, resource_name=monitor_name,
@@ -14,7 +14,7 @@ from api.auth import get_current_user
 from utils.audit import log_action
 from utils.notifications import (
     VALID_CHANNEL_TYPES,
-    encrypt_password, send_email_with_config, send_webhook_with_payload,
+    encrypt_password, clear_decrypted_password_cache, clear_smtp_config_cache, send_email_with_config, send_webhook_with_payload,
     format_slack_payload, format_discord_payload, format_generic_payload,
     format_pagerduty_payload, format_opsgenie_payload, format_teams_payload,
     format_telegram_payload, format_ntfy_payload, format_matrix_payload,
@@ -86,6 +86,8 @@ def update_smtp_config(
         db.add(config)
 
     db.commit()
+    clear_decrypted_password_cache()
+    clear_smtp_config_cache()
     db.refresh(config)
     return config
 
@@ -137,6 +139,7 @@ You can now enable email notifications for your services.
         config.is_tested = True
         config.tested_at = datetime.utcnow()
         db.commit()
+        clear_smtp_config_cache()
         return {"success": True, "message": f"Test email sent to {test_email}"}
     else:
         raise HTTPException(status_code=500, detail=f"Failed to send test email: {error}")
@@ -432,6 +435,7 @@ def get_service_notification_settings(
             email_enabled=False,
             channel_ids="[]",
             cooldown_minutes=5,
+            debounce_seconds=5,
             notify_on_recovery=True
         )
         db.add(settings)
@@ -462,6 +466,7 @@ def update_service_notification_settings(
             email_recipients=settings_data.email_recipients,
             channel_ids=settings_data.channel_ids,
             cooldown_minutes=settings_data.cooldown_minutes,
+            debounce_seconds=settings_data.debounce_seconds,
             notify_on_recovery=settings_data.notify_on_recovery
         )
         db.add(settings)
@@ -472,6 +477,7 @@ def update_service_notification_settings(
         settings.email_recipients = settings_data.email_recipients
         settings.channel_ids = settings_data.channel_ids
         settings.cooldown_minutes = settings_data.cooldown_minutes
+        settings.debounce_seconds = settings_data.debounce_seconds
         settings.notify_on_recovery = settings_data.notify_on_recovery
         settings.updated_at = datetime.utcnow()
 
@@ -7,7 +7,7 @@ from sqlalchemy.orm import Session
 from database import get_db, Service, Incident
 from datetime import datetime, timedelta
 from utils.uptime import calculate_service_uptime_window
-from utils.service_status import get_service_current_status
+from utils.service_status import get_services_current_status
 
 router = APIRouter(prefix="/api/v1", tags=["public_status"])
 
@@ -31,9 +31,11 @@ def get_public_status(db: Session = Depends(get_db)):
     result = []
     seven_days_ago = datetime.utcnow() - timedelta(days=7)
 
+    # Current status of every listed service in one query
+    statuses = get_services_current_status(db, [service.id for service in services])
+
     for service in services:
-        # Get current status using shared utility
-        status_data = get_service_current_status(db, service.id)
+        status_data = statuses[service.id]
 
         # Calculate 7-day uptime percentage
         uptime_percentage = calculate_service_uptime_window(db, service.id, seven_days_ago)
@@ -113,7 +113,7 @@ def export_services(
         }
 
         for monitor in monitors:
-            config = json.loads(monitor.config_json) if monitor.config_json else {}
+            config = monitor.config
             service_data["monitors"].append({
                 "type": monitor.monitor_type,
                 "config": config,
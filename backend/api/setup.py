@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 from database import get_db, User, AppSettings
 from utils.auth import hash_password, generate_api_key
+from utils.db import username_exists
 from utils.password_validation import validate_password, validate_password_match
 from utils.audit import log_action
 import logging
@@ -76,8 +77,7 @@ def complete_setup(setup: SetupRequest, req: Request, db: Session = Depends(get_
         raise HTTPException(status_code=400, detail=error_msg)
 
     # Check if username already exists (shouldn't happen on fresh install)
-    existing_user = db.query(User).filter(User.username == setup.username).first()
-    if existing_user:
+    if username_exists(db, setup.username):
         raise HTTPException(status_code=400, detail="Username already exists")
 
     # Create admin user
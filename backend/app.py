@@ -2,7 +2,10 @@
 Main FastAPI application for SimpleWatch.
 """
 import os
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, JSONResponse
@@ -12,15 +15,27 @@ from sqlalchemy import text
 from database import init_db, SessionLocal
 from utils.db import initialize_encryption_key, initialize_jwt_secret
 from utils.auth import set_secret_key
+from utils.notifications import init_cipher_suite
 import scheduler as scheduler_module
 from scheduler import start_scheduler, stop_scheduler
+from utils.service_helpers import flush_pending_notifications
 
 from api import auth, dashboard, services, users, monitors, monitor_ingestion, notifications, setup, settings, incidents, public_status, maintenance, ai, graphs, audit
 
+# Records are handed to a background listener thread, so request and scheduler
+# threads never block on stdout writes. The listener flushes on interpreter exit.
+_log_queue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
+_log_listener = QueueListener(_log_queue, _log_stream_handler)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    handlers=[QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 
@@ -35,6 +50,7 @@ async def lifespan(app: FastAPI):
     db = SessionLocal()
     try:
         initialize_encryption_key(db)
+        init_cipher_suite(db)
         logger.info("Encryption key initialized")
 
         jwt_secret = initialize_jwt_secret(db)
@@ -49,6 +65,8 @@ async def lifespan(app: FastAPI):
     yield
 
     stop_scheduler()
+    # Don't drop alerts still inside their debounce window
+    flush_pending_notifications()
     logger.info("SimpleWatch stopped")
 
 
@@ -2,10 +2,17 @@
 Database initialization and configuration for SimpleWatch.
 """
 import os
-from sqlalchemy import create_engine, Column, Integer, String, Text, Boolean, TIMESTAMP, ForeignKey, JSON, Float
+from sqlalchemy import (
+    bindparam, case, create_engine, event, inspect, or_, text, update,
+    Column, Integer, String, Text, Boolean, TIMESTAMP, ForeignKey, JSON, Float, Index
+)
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import Session, sessionmaker, relationship, validates
+from sqlalchemy.orm.attributes import set_committed_value
+import logging
 from datetime import datetime
+from typing import List, Optional
+from utils import fastjson
 
 DATABASE_PATH = "/data/simplewatch.db"
 SQLALCHEMY_DATABASE_URL = f"sqlite:////{DATABASE_PATH}"
@@ -19,6 +26,8 @@ engine = create_engine(
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+logger = logging.getLogger(__name__)
+
 
 class User(Base):
     __tablename__ = "users"
@@ -62,6 +71,7 @@ class Service(Base):
     cached_sla_status = Column(String(20))  # 'ok', 'at_risk', 'breached'
     cached_sla_error_budget_seconds = Column(Integer)  # Remaining error budget
     cached_sla_updated_at = Column(TIMESTAMP)  # Last cache update time
+    cached_sla_input_key = Column(String(255))  # Inputs the cached SLA was computed from
 
     owner = relationship("User", back_populates="services")
     status_updates = relationship("StatusUpdate", back_populates="service", cascade="all, delete-orphan")
@@ -84,6 +94,58 @@ class StatusUpdate(Base):
     service = relationship("Service", back_populates="status_updates")
     monitor = relationship("Monitor")
 
+    __table_args__ = (
+        # Latest update per monitor (ORDER BY timestamp DESC LIMIT 1) is an index seek
+        Index("ix_status_updates_monitor_time", "monitor_id", "timestamp"),
+        # Per-service history scans (uptime, SLA) in timestamp order
+        Index("ix_status_updates_service_time", "service_id", "timestamp"),
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _record_latest_monitor_status(session, flush_context):
+    """
+    Copy newly inserted status updates onto their monitor's latest_* columns,
+    in the same transaction, so status lookups don't need to search status_updates.
+    """
+    for obj in session.new:
+        if not isinstance(obj, StatusUpdate) or obj.monitor_id is None:
+            continue
+
+        values = {
+            "latest_status": obj.status,
+            "latest_status_at": obj.timestamp,
+            "latest_response_time_ms": obj.response_time_ms,
+            "latest_metadata_json": obj.metadata_json
+        }
+        monitors = Monitor.__table__
+        # Guard on the timestamp so backfilled/out-of-order updates don't win
+        session.connection().execute(
+            update(monitors).where(
+                monitors.c.id == obj.monitor_id,
+                or_(
+                    monitors.c.latest_status_at.is_(None),
+                    monitors.c.latest_status_at <= obj.timestamp
+                )
+            ).values(
+                latest_status_changed_at=case(
+                    (monitors.c.latest_status.is_distinct_from(obj.status), obj.timestamp),
+                    else_=monitors.c.latest_status_changed_at
+                ),
+                **values
+            )
+        )
+
+        # Keep an already loaded monitor in step without marking it dirty
+        monitor = session.identity_map.get((Monitor, (obj.monitor_id,), None))
+        if monitor is not None and (
+            monitor.latest_status_at is None or monitor.latest_status_at <= obj.timestamp
+        ):
+            if monitor.latest_status != obj.status:
+                set_committed_value(monitor, "latest_status_changed_at", obj.timestamp)
+            for key, value in values.items():
+                set_committed_value(monitor, key, value)
+
 
 class DashboardLayout(Base):
     __tablename__ = "dashboard_layouts"
@@ -109,10 +171,33 @@ class Monitor(Base):
     next_check_at = Column(TIMESTAMP)
     created_at = Column(TIMESTAMP, default=datetime.utcnow)
     created_by = Column(Integer, ForeignKey("users.id"))
+    # Copy of the latest StatusUpdate, maintained on flush (see _record_latest_monitor_status)
+    latest_status = Column(String(50))
+    latest_status_at = Column(TIMESTAMP)
+    latest_response_time_ms = Column(Integer)
+    latest_metadata_json = Column(Text)
+    latest_status_changed_at = Column(TIMESTAMP)  # When latest_status last took a different value
 
     service = relationship("Service", back_populates="monitors")
     creator = relationship("User", back_populates="monitors")
 
+    __table_args__ = (
+        Index("ix_monitors_service_active", "service_id", "is_active"),
+    )
+
+    @property
+    def config(self) -> dict:
+        """
+        Parsed config_json, memoized on the instance until config_json changes
+        (assignment or refresh). Shared between callers, so treat it as read-only.
+        """
+        raw = self.config_json
+        cached = self.__dict__.get("_config_cache")
+        if cached is None or cached[0] is not raw:
+            cached = (raw, fastjson.loads(raw) if raw else {})
+            self.__dict__["_config_cache"] = cached
+        return cached[1]
+
 
 class SMTPConfig(Base):
     __tablename__ = "smtp_config"
@@ -159,12 +244,34 @@ class ServiceNotificationSettings(Base):
     email_recipients = Column(Text)  # Comma-separated
     channel_ids = Column(Text)  # JSON array
     cooldown_minutes = Column(Integer, nullable=False, default=5)
+    debounce_seconds = Column(Integer, default=5)  # Status changes within this window send one notification
     notify_on_recovery = Column(Boolean, nullable=False, default=True)
     last_notification_sent_at = Column(TIMESTAMP)
     last_notified_status = Column(String(50))
     created_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow)
     updated_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    @validates("email_recipients")
+    def _normalize_email_recipients(self, key, value):
+        """Store recipients as 'a@x,b@y': trimmed, without empty entries."""
+        if value is None:
+            return None
+        return ",".join(email.strip() for email in value.split(",") if email.strip()) or None
+
+    @property
+    def email_recipient_list(self) -> list:
+        """
+        email_recipients as a list, memoized on the instance until the column changes.
+        Rows saved before normalization may still contain spaces, so entries are trimmed.
+        """
+        raw = self.email_recipients
+        cached = self.__dict__.get("_recipients_cache")
+        if cached is None or cached[0] is not raw:
+            recipients = [email.strip() for email in raw.split(",") if email.strip()] if raw else []
+            cached = (raw, recipients)
+            self.__dict__["_recipients_cache"] = cached
+        return cached[1]
+
 
 class NotificationLog(Base):
     __tablename__ = "notification_log"
@@ -359,6 +466,96 @@ def init_db():
     """Initialize database and create all tables."""
     Base.metadata.create_all(bind=engine)
 
+    # create_all skips tables that already exist, so add columns and indexes
+    # introduced since an existing database was created
+    added = _add_missing_columns()
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+    added_monitor_columns = added.get("monitors", [])
+    if "latest_status" in added_monitor_columns or "latest_status_changed_at" in added_monitor_columns:
+        with engine.begin() as conn:
+            refresh_latest_monitor_status(conn)
+        logger.info("Backfilled latest monitor status")
+
+
+def _add_missing_columns() -> dict:
+    """
+    Add model columns missing from existing tables with ALTER TABLE ADD COLUMN.
+
+    Only nullable columns without server defaults are supported, which is what
+    SQLite can add in place.
+
+    Returns: Dict of table name -> list of added column names
+    """
+    inspector = inspect(engine)
+    added = {}
+
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN "{column.name}" {column_type}'))
+                added.setdefault(table.name, []).append(column.name)
+                logger.info(f"Added column {table.name}.{column.name}")
+
+    return added
+
+
+def refresh_latest_monitor_status(conn, monitor_ids: Optional[List[int]] = None):
+    """
+    Re-derive the monitors.latest_* columns from the status_updates rows, e.g. after
+    adding the columns or after old rows were deleted. Monitors without any rows
+    get NULLs.
+
+    latest_status_changed_at becomes the timestamp of the first row after the most
+    recent row with a different status (the earliest row if the status never changed),
+    matching what _record_latest_monitor_status maintains.
+
+    Args:
+        conn: Connection to run the UPDATE on (inside the caller's transaction)
+        monitor_ids: Monitors to refresh; all monitors when None
+    """
+    latest = (
+        "(SELECT {column} FROM status_updates"
+        " WHERE status_updates.monitor_id = monitors.id"
+        " ORDER BY status_updates.timestamp DESC LIMIT 1)"
+    )
+    last_other_status_at = (
+        "(SELECT MAX(other.timestamp) FROM status_updates AS other"
+        " WHERE other.monitor_id = monitors.id"
+        f" AND other.status != {latest.format(column='status')})"
+    )
+    changed_at = (
+        "(SELECT MIN(run.timestamp) FROM status_updates AS run"
+        " WHERE run.monitor_id = monitors.id"
+        f" AND run.timestamp > COALESCE({last_other_status_at}, ''))"
+    )
+
+    statement = (
+        "UPDATE monitors SET "
+        f"latest_status = {latest.format(column='status')}, "
+        f"latest_status_at = {latest.format(column='timestamp')}, "
+        f"latest_response_time_ms = {latest.format(column='response_time_ms')}, "
+        f"latest_metadata_json = {latest.format(column='metadata_json')}, "
+        f"latest_status_changed_at = {changed_at}"
+    )
+    if monitor_ids is None:
+        conn.execute(text(statement))
+    elif monitor_ids:
+        conn.execute(
+            text(statement + " WHERE monitors.id IN :monitor_ids").bindparams(
+                bindparam("monitor_ids", expanding=True)
+            ),
+            {"monitor_ids": list(monitor_ids)}
+        )
+
 
 def get_db():
     """Dependency to get database session."""
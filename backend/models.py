@@ -202,6 +202,8 @@ class ServiceNotificationSettingsBase(BaseModel):
     email_recipients: Optional[str] = None
     channel_ids: Optional[str] = None  # JSON array string
     cooldown_minutes: int = 5
+    # Kept under the 2-minute lookback of get_affected_monitors
+    debounce_seconds: Optional[int] = Field(default=5, ge=0, le=60)
     notify_on_recovery: bool = True
 
 
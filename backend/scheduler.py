@@ -6,7 +6,10 @@ from concurrent.futures import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from datetime import datetime, timedelta
-from database import SessionLocal, Monitor, StatusUpdate, AppSettings, MaintenanceWindow, AuditLog
+from database import (
+    SessionLocal, Monitor, StatusUpdate, AppSettings, MaintenanceWindow, AuditLog,
+    refresh_latest_monitor_status
+)
 from monitors import MONITOR_CLASSES, PASSIVE_MONITORS
 from utils.service_helpers import persist_monitor_check
 import json
@@ -140,11 +143,21 @@ def cleanup_old_status_updates():
         # Calculate cutoff date
         cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
 
+        # Monitors whose latest status update is about to be deleted
+        stale_monitor_ids = [
+            monitor_id for monitor_id, in db.query(Monitor.id).filter(
+                Monitor.latest_status_at < cutoff_date
+            )
+        ]
+
         # Delete old status updates
         deleted_count = db.query(StatusUpdate).filter(
             StatusUpdate.timestamp < cutoff_date
         ).delete(synchronize_session=False)
 
+        # Keep monitors.latest_* in step with the rows that are left
+        refresh_latest_monitor_status(db.connection(), stale_monitor_ids)
+
         db.commit()
 
         if deleted_count > 0:
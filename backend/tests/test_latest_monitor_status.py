@@ -0,0 +1,77 @@
+"""
+monitors.latest_* columns: maintained on insert, and re-derived from the
+status_updates rows by refresh_latest_monitor_status.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from database import Monitor, Service, StatusUpdate, refresh_latest_monitor_status
+
+START = datetime(2026, 1, 1)
+LATEST_COLUMNS = (
+    "latest_status", "latest_status_at", "latest_response_time_ms",
+    "latest_metadata_json", "latest_status_changed_at"
+)
+
+
+@pytest.fixture
+def monitors(db):
+    service = Service(name="api", created_at=START)
+    db.add(service)
+    db.flush()
+    monitors = [
+        Monitor(service_id=service.id, monitor_type="website", config_json="{}", is_active=True)
+        for _ in range(3)
+    ]
+    db.add_all(monitors)
+    db.commit()
+    return monitors
+
+
+def _record(db, monitor, statuses):
+    for minute, status in enumerate(statuses):
+        db.add(StatusUpdate(
+            service_id=monitor.service_id, monitor_id=monitor.id, status=status,
+            timestamp=START + timedelta(minutes=minute), response_time_ms=minute
+        ))
+        db.commit()
+
+
+def _latest(db, monitor):
+    db.expire(monitor)
+    return {column: getattr(monitor, column) for column in LATEST_COLUMNS}
+
+
+def test_refresh_matches_values_maintained_on_insert(db, monitors):
+    _record(db, monitors[0], ["operational", "operational", "down", "down", "operational", "operational"])
+    _record(db, monitors[1], ["down", "down", "down"])
+    maintained = [_latest(db, monitor) for monitor in monitors]
+
+    assert maintained[0]["latest_status_changed_at"] == START + timedelta(minutes=4)
+    assert maintained[1]["latest_status_changed_at"] == START
+    assert maintained[2]["latest_status"] is None
+
+    # Wipe the columns, as on a database that just gained them
+    db.query(Monitor).update({column: None for column in LATEST_COLUMNS})
+    db.commit()
+    refresh_latest_monitor_status(db.connection())
+    db.commit()
+
+    assert [_latest(db, monitor) for monitor in monitors] == maintained
+
+
+def test_refresh_after_retention_cleanup(db, monitors):
+    _record(db, monitors[0], ["operational", "down", "operational"])
+    _record(db, monitors[1], ["down"])
+    cutoff = START + timedelta(minutes=1)
+
+    stale = [m.id for m in db.query(Monitor).filter(Monitor.latest_status_at < cutoff)]
+    db.query(StatusUpdate).filter(StatusUpdate.timestamp < cutoff).delete(synchronize_session=False)
+    refresh_latest_monitor_status(db.connection(), stale)
+    db.commit()
+
+    assert stale == [monitors[1].id]
+    assert _latest(db, monitors[1]) == dict.fromkeys(LATEST_COLUMNS)
+    # Untouched: its latest row survived the cleanup
+    assert _latest(db, monitors[0])["latest_status_changed_at"] == START + timedelta(minutes=2)
@@ -0,0 +1,82 @@
+"""
+Debounced service status notifications: coalescing, flap cancellation and the
+shutdown flush.
+"""
+import threading
+import time
+
+import pytest
+
+service_helpers = pytest.importorskip("utils.service_helpers", exc_type=ImportError)
+
+
+class _Sent(list):
+    """Recorded (service_id, old_status, new_status) sends; the fixture sets wait_for."""
+    wait_for = None
+
+
+class _Session:
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Record sends instead of notifying; sent.wait_for(n) blocks until n arrived."""
+    calls = _Sent()
+    arrived = threading.Condition()
+
+    def fake_send(db, service_id, old_status, new_status):
+        with arrived:
+            calls.append((service_id, old_status, new_status))
+            arrived.notify_all()
+
+    def wait_for(count, timeout=2.0):
+        with arrived:
+            return arrived.wait_for(lambda: len(calls) >= count, timeout)
+
+    monkeypatch.setattr(service_helpers, "send_service_notification", fake_send)
+    monkeypatch.setattr(service_helpers, "SessionLocal", _Session)
+    calls.wait_for = wait_for
+    yield calls
+    service_helpers.flush_pending_notifications()
+
+
+def test_zero_window_sends_each_change(sent):
+    service_helpers.schedule_service_notification(1, "operational", "down", 0)
+    assert sent.wait_for(1)
+    service_helpers.schedule_service_notification(1, "down", "operational", 0)
+    assert sent.wait_for(2)
+    assert sent == [(1, "operational", "down"), (1, "down", "operational")]
+
+
+def test_burst_sends_once_with_final_status(sent):
+    for status in ("degraded", "down", "down", "degraded"):
+        service_helpers.schedule_service_notification(1, "operational", status, 0.2)
+    assert sent.wait_for(1)
+    time.sleep(0.3)
+    assert sent == [(1, "operational", "degraded")]
+
+
+def test_flap_back_to_start_sends_nothing(sent):
+    service_helpers.schedule_service_notification(1, "operational", "down", 0.2)
+    service_helpers.schedule_service_notification(1, "operational", "operational", 0.2)
+    time.sleep(0.4)
+    assert sent == []
+    assert 1 not in service_helpers._pending_notifications
+
+
+def test_unchanged_status_schedules_nothing(sent):
+    service_helpers.schedule_service_notification(1, "operational", "operational", 0.2)
+    assert 1 not in service_helpers._pending_notifications
+
+
+def test_shutdown_flush_sends_pending(sent):
+    service_helpers.schedule_service_notification(1, "operational", "down", 60)
+    service_helpers.schedule_service_notification(2, "down", "operational", 60)
+    service_helpers.flush_pending_notifications()
+    assert sorted(sent) == [(1, "operational", "down"), (2, "down", "operational")]
+    assert service_helpers._pending_notifications == {}
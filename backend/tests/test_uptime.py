@@ -0,0 +1,113 @@
+"""
+update_uptime_cache must agree with a straightforward reference calculation:
+walk every status change in time order and re-derive the service status from
+all monitors at each step.
+"""
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from database import Monitor, Service, StatusUpdate
+from utils import uptime
+
+NOW = datetime(2026, 1, 1)
+
+
+class _Clock(datetime):
+    """datetime stand-in with a fixed utcnow()."""
+
+    @classmethod
+    def utcnow(cls):
+        return NOW
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    monkeypatch.setattr(uptime, "datetime", _Clock)
+
+
+def _reference_uptime(db, service_id):
+    """
+    Uptime percentage over the last year, or since creation for younger services.
+    All active monitors count as operational at the start of the period.
+    """
+    service = db.get(Service, service_id)
+    if (NOW - service.created_at).days >= 365:
+        start = NOW - timedelta(days=365)
+    else:
+        start = service.created_at
+
+    monitor_ids = [
+        monitor.id for monitor in db.query(Monitor).filter(
+            Monitor.service_id == service_id, Monitor.is_active == True
+        )
+    ]
+    if not monitor_ids:
+        return None
+
+    updates = db.query(StatusUpdate).filter(
+        StatusUpdate.service_id == service_id,
+        StatusUpdate.monitor_id.in_(monitor_ids),
+        StatusUpdate.timestamp >= start
+    ).order_by(StatusUpdate.timestamp).all()
+    if not updates:
+        return None
+
+    statuses = {monitor_id: "operational" for monitor_id in monitor_ids}
+    operational_seconds = 0.0
+    previous = start
+    for update in updates:
+        if all(status == "operational" for status in statuses.values()):
+            operational_seconds += (update.timestamp - previous).total_seconds()
+        statuses[update.monitor_id] = update.status
+        previous = update.timestamp
+    if all(status == "operational" for status in statuses.values()):
+        operational_seconds += (NOW - previous).total_seconds()
+
+    return round(operational_seconds / (NOW - start).total_seconds() * 100, 1)
+
+
+def _add_service(db, rng, name, age_days, monitor_count, update_count):
+    service = Service(name=name, created_at=NOW - timedelta(days=age_days), is_active=True)
+    db.add(service)
+    db.flush()
+    monitors = [
+        Monitor(service_id=service.id, monitor_type="website", config_json="{}", is_active=True)
+        for _ in range(monitor_count)
+    ]
+    db.add_all(monitors)
+    db.flush()
+
+    age_seconds = age_days * 86400
+    for _ in range(update_count):
+        db.add(StatusUpdate(
+            service_id=service.id,
+            monitor_id=rng.choice(monitors).id,
+            timestamp=NOW - timedelta(seconds=rng.uniform(1, age_seconds - 1)),
+            status=rng.choice(["operational", "operational", "degraded", "down"])
+        ))
+    db.commit()
+    return service, monitors
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_cache_matches_reference(db, seed):
+    rng = random.Random(seed)
+    services = [
+        _add_service(db, rng, "single", 20, 1, 40),
+        _add_service(db, rng, "multi", 90, 3, 120),
+        _add_service(db, rng, "old", 500, 2, 200),
+        _add_service(db, rng, "empty", 10, 2, 0),
+    ]
+    # A paused monitor's history doesn't count
+    services[1][1][0].is_active = False
+    db.commit()
+
+    uptime.update_uptime_cache(db)
+
+    for service, _ in services:
+        db.refresh(service)
+        assert service.cached_uptime_percentage == _reference_uptime(db, service.id)
+    assert services[2][0].cached_uptime_period_label == "1y"
+    assert services[3][0].cached_uptime_percentage is None
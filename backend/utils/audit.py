@@ -3,7 +3,6 @@ Audit logging helper for tracking user actions.
 """
 import json
 import logging
-from datetime import datetime
 from sqlalchemy.orm import Session
 from database import AuditLog
 
@@ -44,8 +43,7 @@ def log_action(
             resource_id=resource_id,
             resource_name=resource_name,
             details=json.dumps(details) if details else None,
-            ip_address=ip_address,
-            created_at=datetime.utcnow()
+            ip_address=ip_address
         )
         db.add(entry)
         db.commit()
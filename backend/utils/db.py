@@ -1,10 +1,12 @@
 """
 Database utility functions.
 """
+import logging
 from sqlalchemy.orm import Session
 from database import User, Service, EncryptionKey, AppSettings
 from cryptography.fernet import Fernet
 
+logger = logging.getLogger(__name__)
 
 
 def get_user_by_api_key(db: Session, api_key: str):
@@ -12,11 +14,21 @@ def get_user_by_api_key(db: Session, api_key: str):
     return db.query(User).filter(User.api_key == api_key).first()
 
 
+def api_key_exists(db: Session, api_key: str) -> bool:
+    """Check whether an API key belongs to a user without loading the user row."""
+    return db.query(db.query(User.id).filter(User.api_key == api_key).exists()).scalar()
+
+
 def get_user_by_username(db: Session, username: str):
     """Get user by username."""
     return db.query(User).filter(User.username == username).first()
 
 
+def username_exists(db: Session, username: str) -> bool:
+    """Check whether a username is taken without loading the user row."""
+    return db.query(db.query(User.id).filter(User.username == username).exists()).scalar()
+
+
 def get_service_by_name(db: Session, name: str):
     """Get service by name."""
     return db.query(Service).filter(Service.name == name).first()
@@ -29,7 +41,7 @@ def initialize_encryption_key(db: Session):
     Creates a new Fernet key on first deployment if not exists.
     This is called automatically during app startup.
     """
-    existing_key = db.query(EncryptionKey).first()
+    existing_key = db.query(EncryptionKey.key_value).first()
     if not existing_key:
         # Generate new Fernet key (32 url-safe base64-encoded bytes)
         new_key = Fernet.generate_key()
@@ -38,7 +50,7 @@ def initialize_encryption_key(db: Session):
         )
         db.add(encryption_key)
         db.commit()
-        print("Encryption key auto-generated and stored in database")
+        logger.info("Encryption key auto-generated and stored in database")
         return new_key.decode()
     return existing_key.key_value
 
@@ -64,7 +76,7 @@ def initialize_jwt_secret(db: Session) -> str:
     new_secret = sec_module.token_urlsafe(32)
     db.add(AppSettings(key="jwt_secret", value=new_secret))
     db.commit()
-    print("JWT secret auto-generated and stored in database")
+    logger.info("JWT secret auto-generated and stored in database")
     return new_secret
 
 
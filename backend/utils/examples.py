@@ -2,17 +2,20 @@
 Create example monitors for demonstration.
 """
 import json
+import logging
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from database import Service, Monitor, DashboardLayout, User
 
+logger = logging.getLogger(__name__)
+
 
 def create_example_monitors(db: Session):
     """
     Create 4 example monitors to demonstrate capabilities.
     Only creates them if they don't already exist.
     """
-    admin_user = db.query(User).filter(User.is_admin == True).first()
+    admin_user = db.query(User.id).filter(User.is_admin == True).first()
     if not admin_user:
         return
 
@@ -66,46 +69,58 @@ def create_example_monitors(db: Session):
         }
     ]
 
-    created_services = []
+    # One lookup for all example names instead of one query per example
+    example_names = [example["name"] for example in examples]
+    existing_names = {
+        name for (name,) in db.query(Service.name).filter(Service.name.in_(example_names)).all()
+    }
 
-    for example in examples:
-        existing_service = db.query(Service).filter(Service.name == example["name"]).first()
-        if existing_service:
-            continue
+    new_examples = [example for example in examples if example["name"] not in existing_names]
+    if not new_examples:
+        return
 
-        service = Service(
+    # Insert all services in one flush so their ids are assigned together
+    services = [
+        Service(
             name=example["name"],
             description=example["description"],
             category="Example",
             created_by=admin_user.id,
             is_active=True
         )
-        db.add(service)
-        db.flush()
+        for example in new_examples
+    ]
+    db.add_all(services)
+    db.flush()
 
-        monitor = Monitor(
+    next_check_at = datetime.utcnow() + timedelta(minutes=1)
+    db.add_all([
+        Monitor(
             service_id=service.id,
             monitor_type=example["monitor_type"],
             config_json=json.dumps(example["config"]),
             check_interval_minutes=example["check_interval_minutes"],
             is_active=True,
-            next_check_at=datetime.utcnow() + timedelta(minutes=1),
+            next_check_at=next_check_at,
             created_by=admin_user.id
         )
-        db.add(monitor)
+        for example, service in zip(new_examples, services)
+    ])
 
-        created_services.append({
+    created_services = [
+        {
             "service_id": service.id,
             "name": example["name"],
             "monitor_type": example["monitor_type"]
-        })
+        }
+        for example, service in zip(new_examples, services)
+    ]
 
-    if created_services:
-        db.commit()
+    db.commit()
 
-        create_example_dashboard(db, admin_user.id, created_services)
+    create_example_dashboard(db, admin_user.id, created_services)
 
-        print(f"Created {len(created_services)} example monitors")
+    logger.info(f"Created {len(created_services)} example monitors")
 
 
 def create_example_dashboard(db: Session, user_id: int, services: list):
@@ -155,4 +170,4 @@ def create_example_dashboard(db: Session, user_id: int, services: list):
     db.add(dashboard_layout)
     db.commit()
 
-    print(f"Created example dashboard layout for user {user_id}")
+    logger.info(f"Created example dashboard layout for user {user_id}")
@@ -0,0 +1,65 @@
+"""
+JSON helpers with an optional orjson fast path.
+
+orjson is used when it is installed; otherwise the stdlib json module produces
+the same compact UTF-8 output. Both paths agree on:
+- NaN and +/-Infinity are written as null (valid JSON, orjson's behavior)
+- str, int, float, bool and None dict keys are written as strings
+Decode errors are json.JSONDecodeError either way (orjson's error type
+subclasses it). Types outside plain JSON (datetime, UUID, dataclasses) are only
+encoded by orjson, so convert them before serializing.
+"""
+import json
+import math
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Allow non-string keys like the stdlib does
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+# Compact separators and raw UTF-8, matching orjson's output. allow_nan=False
+# makes non-finite floats raise so they can be replaced with null.
+_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+
+
+def _replace_non_finite(obj):
+    """Copy of obj with NaN/Infinity floats replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _replace_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(value) for value in obj]
+    return obj
+
+
+def _encode(obj) -> str:
+    """Stdlib encoding; only walks obj again when it contains non-finite floats."""
+    try:
+        return _encoder.encode(obj)
+    except ValueError:
+        return _encoder.encode(_replace_non_finite(obj))
+
+
+def dumps(obj) -> str:
+    """Serialize obj to a compact JSON string."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode("utf-8")
+    return _encode(obj)
+
+
+def dumps_bytes(obj) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes, e.g. for a request body."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    return _encode(obj).encode("utf-8")
+
+
+def loads(data):
+    """Parse JSON from a str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -2,13 +2,25 @@
 Notification utilities for email and webhooks.
 """
 import os
+import random
+import re
 import smtplib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+from urllib.parse import urlsplit
 import json
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Dict, Any, List
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from email.message import EmailMessage
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple, Union
 from cryptography.fernet import Fernet
+from utils import fastjson
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,9 +30,49 @@ VALID_CHANNEL_TYPES = [
     'telegram', 'ntfy', 'matrix', 'generic'
 ]
 
+# Shared HTTP session for every channel sender, so repeated notifications to the
+# same host reuse keep-alive connections instead of paying a TCP + TLS handshake.
+# Retries are handled by _send_request, so the adapter itself does not retry.
+_http_session = requests.Session()
+_http_adapter = HTTPAdapter(
+    pool_connections=50,
+    pool_maxsize=200
+)
+_http_session.mount("https://", _http_adapter)
+_http_session.mount("http://", _http_adapter)
+# (connect, read) seconds: an unreachable host fails fast instead of holding a worker
+_HTTP_TIMEOUT = (3.05, 10)
+
+# Application-level attempts per notification request. Connection errors, timeouts,
+# 429 and 5xx responses are retried with backoff; other 4xx responses fail at once.
+# POST is not idempotent, so it is only retried when the request never reached the
+# server, or on a 429 with Retry-After (see _send_request).
+_SEND_ATTEMPTS = 3
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+_MAX_RETRY_AFTER_SECONDS = 5
+
 # Encryption key is now managed in the database
-# Will be retrieved from utils.db.get_encryption_key() when needed
+# Loaded once at startup by init_cipher_suite(); _get_cipher_suite() falls back
+# to a locked lazy load for processes that skip the app lifespan (scripts, tests).
 _cipher_suite_cache = None
+_cipher_lock = threading.Lock()
+
+
+def init_cipher_suite(db) -> None:
+    """
+    Load the Fernet cipher suite from the database encryption key.
+    Called once from app startup, after the key has been initialized.
+
+    Args:
+        db: Database session
+    """
+    global _cipher_suite_cache
+    from utils.db import get_encryption_key
+
+    with _cipher_lock:
+        _cipher_suite_cache = Fernet(get_encryption_key(db).encode())
+    _decrypt_cached.cache_clear()
 
 
 def _get_cipher_suite():
@@ -29,18 +81,116 @@ def _get_cipher_suite():
     The encryption key is stored in the database and auto-generated on first deployment.
     """
     global _cipher_suite_cache
-    if _cipher_suite_cache is None:
-        from database import SessionLocal
-        from utils.db import get_encryption_key
+    cipher_suite = _cipher_suite_cache
+    if cipher_suite is None:
+        with _cipher_lock:
+            cipher_suite = _cipher_suite_cache
+            if cipher_suite is None:
+                from database import SessionLocal
+                from utils.db import get_encryption_key
+
+                db = SessionLocal()
+                try:
+                    key = get_encryption_key(db)
+                    cipher_suite = _cipher_suite_cache = Fernet(key.encode())
+                finally:
+                    db.close()
+
+    return cipher_suite
+
+
+# Authenticated SMTP sessions kept open between sends, keyed by the full
+# connection config (a credential change therefore never reuses an old session).
+# Each key holds a small deque of idle sessions, least recently used on the left.
+# A session is borrowed (removed from the pool) while in use, so concurrent
+# senders never share one.
+_SMTP_IDLE_SECONDS = 60
+_SMTP_MAX_MESSAGES = 100  # Recycle a session after this many messages
+_SMTP_MAX_POOLED = 4      # Idle sessions kept per config
+_smtp_pool: Dict[tuple, deque] = {}
+_smtp_pool_lock = threading.Lock()
+
+
+def _smtp_key(smtp_config: dict) -> tuple:
+    return (smtp_config['host'], smtp_config['port'], smtp_config['username'],
+            smtp_config['password_encrypted'], bool(smtp_config['use_tls']))
+
+
+def _close_smtp(server: smtplib.SMTP):
+    """Close an SMTP session, ignoring errors from already-dropped connections."""
+    try:
+        server.quit()
+    except Exception:
+        server.close()
 
-        db = SessionLocal()
+
+def _open_smtp(smtp_config: dict) -> smtplib.SMTP:
+    """Connect, optionally STARTTLS, and log in."""
+    password = decrypt_password(smtp_config['password_encrypted'])
+    server = smtplib.SMTP(smtp_config['host'], smtp_config['port'])
+    try:
+        if smtp_config['use_tls']:
+            server.starttls()
+        server.login(smtp_config['username'], password)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
+def _borrow_smtp(smtp_config: dict) -> Tuple[smtplib.SMTP, int]:
+    """
+    Get a logged-in SMTP session for this config.
+    Reuses the most recently returned pooled session if it still answers NOOP,
+    otherwise opens a new one. Sessions idle for too long are closed.
+
+    Returns:
+        Tuple of (session, number of messages already sent on it)
+    """
+    key = _smtp_key(smtp_config)
+    now = time.monotonic()
+    stale = []
+    entry = None
+
+    with _smtp_pool_lock:
+        for pool_key, entries in list(_smtp_pool.items()):
+            while entries and now - entries[0][1] > _SMTP_IDLE_SECONDS:
+                stale.append(entries.popleft()[0])
+            if pool_key == key and entries:
+                entry = entries.pop()
+            if not entries:
+                del _smtp_pool[pool_key]
+
+    for server in stale:
+        _close_smtp(server)
+
+    if entry:
+        server, _, sent = entry
         try:
-            key = get_encryption_key(db)
-            _cipher_suite_cache = Fernet(key.encode())
-        finally:
-            db.close()
+            if server.noop()[0] == 250:
+                return server, sent
+        except Exception:
+            pass
+        _close_smtp(server)
+
+    return _open_smtp(smtp_config), 0
+
 
-    return _cipher_suite_cache
+def _return_smtp(smtp_config: dict, server: smtplib.SMTP, sent: int):
+    """Put a healthy session back in the pool, or close it once it has sent enough."""
+    if sent >= _SMTP_MAX_MESSAGES:
+        _close_smtp(server)
+        return
+
+    displaced = None
+    with _smtp_pool_lock:
+        entries = _smtp_pool.setdefault(_smtp_key(smtp_config), deque())
+        entries.append((server, time.monotonic(), sent))
+        if len(entries) > _SMTP_MAX_POOLED:
+            displaced = entries.popleft()[0]
+
+    if displaced:
+        _close_smtp(displaced)
 
 
 # ============================================
@@ -56,13 +206,78 @@ def encrypt_password(password: str) -> str:
     return cipher_suite.encrypt(password.encode()).decode()
 
 
+@lru_cache(maxsize=256)
+def _decrypt_cached(encrypted_password: str) -> str:
+    """Decrypt a stored token; results are memoized per token."""
+    cipher_suite = _get_cipher_suite()
+    return cipher_suite.decrypt(encrypted_password.encode()).decode()
+
+
 def decrypt_password(encrypted_password: str) -> str:
     """
     Decrypt password from storage.
     Uses auto-generated encryption key from database.
+    Repeated lookups of the same stored token skip the Fernet verify/decrypt.
     """
-    cipher_suite = _get_cipher_suite()
-    return cipher_suite.decrypt(encrypted_password.encode()).decode()
+    return _decrypt_cached(encrypted_password)
+
+
+def clear_decrypted_password_cache() -> None:
+    """
+    Drop memoized plaintext passwords.
+    Called when the SMTP configuration changes so stale credentials are not kept in memory.
+    """
+    _decrypt_cached.cache_clear()
+
+
+# Tested SMTP settings, reloaded at most once per TTL (the config rarely changes)
+_SMTP_CONFIG_TTL_SECONDS = 60
+_smtp_config_cache: Tuple[float, Optional[dict]] = (0.0, None)
+_smtp_config_lock = threading.Lock()
+
+
+def get_tested_smtp_config(db) -> Optional[dict]:
+    """
+    Get the SMTP settings dict used by send_email_with_config, cached for a short TTL.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Dict with host, port, username, password_encrypted, from_address and use_tls,
+        or None if SMTP is not configured or not tested yet
+    """
+    global _smtp_config_cache
+    from database import SMTPConfig
+
+    with _smtp_config_lock:
+        loaded_at, config = _smtp_config_cache
+        if time.monotonic() - loaded_at < _SMTP_CONFIG_TTL_SECONDS:
+            return config
+
+        smtp_config = db.query(SMTPConfig).first()
+        config = None
+        if smtp_config and smtp_config.is_tested:
+            config = {
+                'host': smtp_config.host,
+                'port': smtp_config.port,
+                'username': smtp_config.username,
+                'password_encrypted': smtp_config.password_encrypted,
+                'from_address': smtp_config.from_address,
+                'use_tls': smtp_config.use_tls
+            }
+        _smtp_config_cache = (time.monotonic(), config)
+        return config
+
+
+def clear_smtp_config_cache() -> None:
+    """
+    Drop the cached SMTP settings.
+    Called when the SMTP configuration is saved or tested.
+    """
+    global _smtp_config_cache
+    with _smtp_config_lock:
+        _smtp_config_cache = (0.0, None)
 
 
 def send_email_with_config(smtp_config: dict, to_emails: List[str],
@@ -80,23 +295,29 @@ def send_email_with_config(smtp_config: dict, to_emails: List[str],
         Tuple of (success: bool, error_message: str or None)
     """
     try:
-        # Decrypt password
-        password = decrypt_password(smtp_config['password_encrypted'])
-
-        # Create message
-        msg = MIMEMultipart()
+        # Create message (single text/plain part, no multipart envelope)
+        msg = EmailMessage()
         msg['From'] = smtp_config['from_address']
         msg['To'] = ', '.join(to_emails)
         msg['Subject'] = subject
-        msg.attach(MIMEText(body, 'plain'))
+        msg.set_content(body)
 
-        # Connect and send
-        server = smtplib.SMTP(smtp_config['host'], smtp_config['port'])
-        if smtp_config['use_tls']:
-            server.starttls()
-        server.login(smtp_config['username'], password)
-        server.send_message(msg)
-        server.quit()
+        # Send over a pooled session; a failed session is dropped, not reused
+        server, sent = _borrow_smtp(smtp_config)
+        try:
+            try:
+                server.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                if not sent:
+                    raise
+                # The server dropped a reused session after NOOP; retry once on a fresh one
+                server.close()
+                server, sent = _open_smtp(smtp_config), 0
+                server.send_message(msg)
+        except Exception:
+            server.close()
+            raise
+        _return_smtp(smtp_config, server, sent + 1)
 
         logger.info(f"Email sent to {to_emails}: {subject}")
         return True, None
@@ -107,14 +328,81 @@ def send_email_with_config(smtp_config: dict, to_emails: List[str],
         return False, error_msg
 
 
-def send_webhook_with_payload(webhook_url: str, payload: dict,
-                               secret_token: str = None) -> tuple[bool, str]:
+def encode_json_payload(payload: dict) -> bytes:
+    """
+    Serialize a webhook payload to compact UTF-8 JSON.
+
+    Args:
+        payload: JSON-serializable payload dict
+
+    Returns:
+        Encoded request body
+    """
+    return fastjson.dumps_bytes(payload)
+
+
+def _send_request(method: str, url: str, **kwargs) -> requests.Response:
+    """
+    Send a notification request over the shared session with bounded retries.
+
+    Connection errors, timeouts, 429 and 5xx responses are retried with jittered
+    exponential backoff (a short Retry-After is honoured); anything else fails at once.
+    A POST may already have been delivered after a read timeout, a dropped connection
+    or a 5xx, and retrying would send a duplicate alert. So a POST is only retried
+    when the connection could not be opened, or on a 429 carrying Retry-After.
+
+    Raises:
+        requests.HTTPError: On a non-retryable response, or a retryable one on the last attempt
+        requests.ConnectionError, requests.Timeout: After the last attempt
+    """
+    host = urlsplit(url).netloc  # URLs may embed tokens (Telegram), so only log the host
+    idempotent = method.upper() in _IDEMPOTENT_METHODS
+    for attempt in range(_SEND_ATTEMPTS):
+        last_attempt = attempt == _SEND_ATTEMPTS - 1
+        delay = 0.2 * 2 ** attempt + random.random() * 0.1
+        try:
+            response = _http_session.request(method, url, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            if last_attempt or not (idempotent or _failed_before_sending(e)):
+                raise
+            reason = type(e).__name__
+        else:
+            retry_after = response.headers.get("Retry-After", "")
+            retryable = response.status_code in _RETRYABLE_STATUS and (
+                idempotent or (response.status_code == 429 and retry_after.isdigit())
+            )
+            if not retryable or last_attempt:
+                response.raise_for_status()
+                return response
+            reason = f"HTTP {response.status_code}"
+            if retry_after.isdigit():
+                delay = max(delay, min(int(retry_after), _MAX_RETRY_AFTER_SECONDS))
+
+        logger.warning(f"Notification request to {host} failed ({reason}), retrying in {delay:.2f}s")
+        time.sleep(delay)
+
+
+def _failed_before_sending(error: Exception) -> bool:
+    """
+    Whether a requests error means the request was never sent: a connect timeout,
+    or a connection that could not be opened (refused, DNS failure).
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.exceptions.ConnectionError):
+        return False
+    cause = error.args[0] if error.args else None
+    return isinstance(cause, MaxRetryError) and isinstance(cause.reason, NewConnectionError)
+
+
+def send_webhook_with_payload(webhook_url: str, payload: Union[dict, bytes],
+                              secret_token: str = None) -> tuple[bool, str]:
     """
     Send webhook notification with given payload.
 
     Args:
         webhook_url: Webhook destination URL
-        payload: JSON payload to send
+        payload: JSON payload to send, as a dict or an already-encoded JSON body
         secret_token: Optional secret token for authentication
 
     Returns:
@@ -125,13 +413,8 @@ def send_webhook_with_payload(webhook_url: str, payload: dict,
         if secret_token:
             headers["X-Webhook-Secret"] = secret_token
 
-        response = requests.post(
-            webhook_url,
-            json=payload,
-            headers=headers,
-            timeout=10
-        )
-        response.raise_for_status()
+        body = payload if isinstance(payload, bytes) else encode_json_payload(payload)
+        _send_request("POST", webhook_url, data=body, headers=headers, timeout=_HTTP_TIMEOUT)
 
         logger.info(f"Webhook sent to {webhook_url}")
         return True, None
@@ -142,18 +425,42 @@ def send_webhook_with_payload(webhook_url: str, payload: dict,
         return False, error_msg
 
 
+_PAGERDUTY_EVENTS_URL = "https://events.pagerduty.com/v2/enqueue"
+_OPSGENIE_ALERTS_URL = "https://api.opsgenie.com/v2/alerts"
+# Header mappings are shared between calls, so they are read-only views
+_JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+
+@lru_cache(maxsize=64)
+def _opsgenie_headers(api_key: str) -> MappingProxyType:
+    """Request headers for an Opsgenie API key."""
+    return MappingProxyType({
+        "Content-Type": "application/json",
+        "Authorization": f"GenieKey {api_key}"
+    })
+
+
+@lru_cache(maxsize=64)
+def _bearer_json_headers(access_token: str) -> MappingProxyType:
+    """Request headers for a bearer-token JSON API (Matrix)."""
+    return MappingProxyType({
+        "Authorization": f"Bearer {access_token}",
+        "Content-Type": "application/json"
+    })
+
+
 def send_pagerduty(routing_key: str, payload: dict) -> tuple[bool, str]:
     """
     Send alert to PagerDuty Events API v2.
     """
     try:
-        response = requests.post(
-            "https://events.pagerduty.com/v2/enqueue",
-            json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=10
+        _send_request(
+            "POST",
+            _PAGERDUTY_EVENTS_URL,
+            data=encode_json_payload(payload),
+            headers=_JSON_HEADERS,
+            timeout=_HTTP_TIMEOUT
         )
-        response.raise_for_status()
         logger.info(f"PagerDuty alert sent (action: {payload.get('event_action')})")
         return True, None
     except Exception as e:
@@ -168,29 +475,27 @@ def send_opsgenie(api_key: str, payload: dict) -> tuple[bool, str]:
     Handles both create and close actions.
     """
     try:
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"GenieKey {api_key}"
-        }
+        headers = _opsgenie_headers(api_key)
 
         # Check if this is a close action
         if payload.get("_opsgenie_action") == "close":
             alias = payload.get("alias")
-            response = requests.post(
-                f"https://api.opsgenie.com/v2/alerts/{alias}/close?identifierType=alias",
-                json={"source": "SimpleWatch"},
+            _send_request(
+                "POST",
+                f"{_OPSGENIE_ALERTS_URL}/{alias}/close?identifierType=alias",
+                data=encode_json_payload({"source": "SimpleWatch"}),
                 headers=headers,
-                timeout=10
+                timeout=_HTTP_TIMEOUT
             )
         else:
-            response = requests.post(
-                "https://api.opsgenie.com/v2/alerts",
-                json=payload,
+            _send_request(
+                "POST",
+                _OPSGENIE_ALERTS_URL,
+                data=encode_json_payload(payload),
                 headers=headers,
-                timeout=10
+                timeout=_HTTP_TIMEOUT
             )
 
-        response.raise_for_status()
         logger.info(f"Opsgenie alert sent")
         return True, None
     except Exception as e:
@@ -199,18 +504,31 @@ def send_opsgenie(api_key: str, payload: dict) -> tuple[bool, str]:
         return False, error_msg
 
 
+@lru_cache(maxsize=64)
+def _telegram_send_url(bot_token: str) -> str:
+    """sendMessage endpoint for a bot token."""
+    return f"https://api.telegram.org/bot{bot_token}/sendMessage"
+
+
+@lru_cache(maxsize=64)
+def _matrix_send_url_prefix(homeserver_url: str, room_id: str) -> str:
+    """Room message endpoint up to (not including) the transaction ID."""
+    return f"{homeserver_url}/_matrix/client/r0/rooms/{room_id}/send/m.room.message/"
+
+
 def send_telegram(bot_token: str, payload: dict) -> tuple[bool, str]:
     """
     Send message via Telegram Bot API.
     """
     try:
-        url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-        response = requests.post(
+        url = _telegram_send_url(bot_token)
+        _send_request(
+            "POST",
             url,
-            json=payload,
-            timeout=10
+            data=encode_json_payload(payload),
+            headers=_JSON_HEADERS,
+            timeout=_HTTP_TIMEOUT
         )
-        response.raise_for_status()
         logger.info(f"Telegram message sent to chat {payload.get('chat_id')}")
         return True, None
     except Exception as e:
@@ -235,13 +553,13 @@ def send_ntfy(topic_url: str, payload: dict, access_token: str = None) -> tuple[
         if access_token:
             headers["Authorization"] = f"Bearer {access_token}"
 
-        response = requests.post(
+        _send_request(
+            "POST",
             topic_url,
             data=body.encode('utf-8'),
             headers=headers,
-            timeout=10
+            timeout=_HTTP_TIMEOUT
         )
-        response.raise_for_status()
         logger.info(f"ntfy notification sent to {topic_url}")
         return True, None
     except Exception as e:
@@ -261,20 +579,16 @@ def send_matrix(homeserver_url: str, room_id: str, access_token: str, payload: d
         payload: Message payload
     """
     try:
-        import time
-        txn_id = int(time.time() * 1000)
-        url = f"{homeserver_url}/_matrix/client/r0/rooms/{room_id}/send/m.room.message/{txn_id}"
+        txn_id = time.time_ns() // 1_000_000
+        url = f"{_matrix_send_url_prefix(homeserver_url, room_id)}{txn_id}"
 
-        response = requests.put(
+        _send_request(
+            "PUT",
             url,
-            json=payload,
-            headers={
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json"
-            },
-            timeout=10
+            data=encode_json_payload(payload),
+            headers=_bearer_json_headers(access_token),
+            timeout=_HTTP_TIMEOUT
         )
-        response.raise_for_status()
         logger.info(f"Matrix message sent to {room_id}")
         return True, None
     except Exception as e:
@@ -283,9 +597,81 @@ def send_matrix(homeserver_url: str, room_id: str, access_token: str, payload: d
         return False, error_msg
 
 
+@dataclass(slots=True, frozen=True)
+class StatusCounts:
+    """Monitor counts shared by every formatter for one status change."""
+    operational: int
+    total: int
+    affected_names: Tuple[str, ...]
+    affected_preview: str  # First three affected names, plus "(+N more)"
+
+
+def build_counts(all_monitors: List[dict], affected_monitors: List[dict]) -> StatusCounts:
+    """
+    Compute monitor counts once per status change.
+
+    The result is passed to every formatter via counts= so a fan-out to many
+    channels does not rescan the monitor lists per channel.
+
+    Args:
+        all_monitors: List of all monitors for the service (dicts with a 'status' key)
+        affected_monitors: List of monitors that changed (dicts with a 'name' key)
+
+    Returns:
+        StatusCounts for the formatters
+    """
+    affected_names = tuple(m['name'] for m in affected_monitors)
+    affected_preview = ", ".join(affected_names[:3])
+    if len(affected_names) > 3:
+        affected_preview += f" (+{len(affected_names) - 3} more)"
+
+    return StatusCounts(
+        operational=sum(1 for m in all_monitors if m['status'] == 'operational'),
+        total=len(all_monitors),
+        affected_names=affected_names,
+        affected_preview=affected_preview
+    )
+
+
+# Per-status styles for the formatters; unrecognised statuses use the down style
+# (emoji, color, title suffix)
+_SLACK_STYLE = {
+    "operational": ("✅", "good", "recovered"),      # Green
+    "degraded": ("🟡", "warning", "is DEGRADED"),    # Yellow
+    "down": ("🔴", "danger", "is DOWN"),             # Red
+}
+_DISCORD_STYLE = {
+    "operational": ("✅", 5763719, "recovered"),     # Green
+    "degraded": ("🟡", 16763904, "is DEGRADED"),     # Yellow/Orange
+    "down": ("🔴", 15158332, "is DOWN"),             # Red
+}
+# Teams titles share the Slack emoji/suffix; only the card color is Teams-specific
+_TEAMS_THEME_COLOR = {"down": "FF0000", "degraded": "FFA500"}  # Anything else: green
+# (event_action, severity)
+_PAGERDUTY_STYLE = {
+    "operational": ("resolve", "info"),
+    "degraded": ("trigger", "warning"),
+    "down": ("trigger", "critical"),
+}
+_OPSGENIE_PRIORITY = {"degraded": "P3", "down": "P1"}
+# (emoji, status text) for Telegram and Matrix messages
+_MESSAGE_STYLE = {
+    "operational": ("✅", "recovered"),
+    "degraded": ("🟡", "DEGRADED"),
+    "down": ("🔴", "DOWN"),
+}
+# (priority, tag, title suffix)
+_NTFY_STYLE = {
+    "operational": ("default", "white_check_mark", "recovered"),
+    "degraded": ("high", "warning", "is DEGRADED"),
+    "down": ("urgent", "rotating_light", "is DOWN"),
+}
+_STATUS_EMOJI = {"operational": "✅", "degraded": "🟡", "down": "🔴"}
+
+
 def format_slack_payload(service_name: str, old_status: str, new_status: str,
                          affected_monitors: List[dict], all_monitors: List[dict],
-                         timestamp: str) -> dict:
+                         timestamp: str, counts: StatusCounts = None) -> dict:
     """
     Format notification payload for Slack Block Kit.
 
@@ -296,33 +682,24 @@ def format_slack_payload(service_name: str, old_status: str, new_status: str,
         affected_monitors: List of monitors that changed (dict with name, type, status, error)
         all_monitors: List of all monitors for this service (dict with name, status, response_time)
         timestamp: ISO timestamp of status change
+        counts: Optional precomputed build_counts() result, shared across channels
 
     Returns:
         Slack-formatted payload dict
     """
-    # Determine emoji and color
-    if new_status == "operational":
-        emoji = "✅"
-        color = "good"  # Green
-        title = f"{emoji} {service_name} recovered"
-    elif new_status == "degraded":
-        emoji = "🟡"
-        color = "warning"  # Yellow
-        title = f"{emoji} {service_name} is DEGRADED"
-    else:  # down
-        emoji = "🔴"
-        color = "danger"  # Red
-        title = f"{emoji} {service_name} is DOWN"
+    # Determine emoji and color (anything unrecognised is treated as down)
+    emoji, color, state = _SLACK_STYLE.get(new_status, _SLACK_STYLE["down"])
+    title = f"{emoji} {service_name} {state}"
 
     # Count operational monitors
-    operational_count = sum(1 for m in all_monitors if m['status'] == 'operational')
-    total_count = len(all_monitors)
+    counts = counts or build_counts(all_monitors, affected_monitors)
+    operational_count, total_count = counts.operational, counts.total
 
     # Format affected monitors
-    affected_text = "\n".join([
+    affected_text = "\n".join(
         f"❌ {m['name']} ({m['type']}) - {m.get('error', 'failed')}"
         for m in affected_monitors
-    ]) if affected_monitors else "All monitors recovered"
+    ) if affected_monitors else "All monitors recovered"
 
     return {
         "attachments": [{
@@ -362,7 +739,7 @@ def format_slack_payload(service_name: str, old_status: str, new_status: str,
 
 def format_discord_payload(service_name: str, old_status: str, new_status: str,
                            affected_monitors: List[dict], all_monitors: List[dict],
-                           timestamp: str) -> dict:
+                           timestamp: str, counts: StatusCounts = None) -> dict:
     """
     Format notification payload for Discord embeds.
 
@@ -371,30 +748,20 @@ def format_discord_payload(service_name: str, old_status: str, new_status: str,
     Returns:
         Discord-formatted payload dict
     """
-    # Determine emoji and color
-    if new_status == "operational":
-        emoji = "✅"
-        color = 5763719  # Green
-        title = f"{emoji} {service_name} recovered"
-    elif new_status == "degraded":
-        emoji = "🟡"
-        color = 16763904  # Yellow/Orange
-        title = f"{emoji} {service_name} is DEGRADED"
-    else:  # down
-        emoji = "🔴"
-        color = 15158332  # Red
-        title = f"{emoji} {service_name} is DOWN"
+    # Determine emoji and color (anything unrecognised is treated as down)
+    emoji, color, state = _DISCORD_STYLE.get(new_status, _DISCORD_STYLE["down"])
+    title = f"{emoji} {service_name} {state}"
 
     # Count operational monitors
-    operational_count = sum(1 for m in all_monitors if m['status'] == 'operational')
-    total_count = len(all_monitors)
+    counts = counts or build_counts(all_monitors, affected_monitors)
+    operational_count, total_count = counts.operational, counts.total
 
     # Format description
     if affected_monitors:
-        affected_text = "\n".join([
+        affected_text = "\n".join(
             f"❌ {m['name']} ({m['type']}) - {m.get('error', 'failed')}"
             for m in affected_monitors
-        ])
+        )
         description = f"**Affected:**\n{affected_text}\n\n**Status:** {operational_count}/{total_count} monitors operational"
     else:
         description = f"All monitors operational ({total_count}/{total_count})"
@@ -414,7 +781,8 @@ def format_discord_payload(service_name: str, old_status: str, new_status: str,
 
 def format_pagerduty_payload(service_name: str, old_status: str, new_status: str,
                               affected_monitors: List[dict], all_monitors: List[dict],
-                              timestamp: str, routing_key: str, service_id: int = None) -> dict:
+                              timestamp: str, routing_key: str, service_id: int = None,
+                              counts: StatusCounts = None) -> dict:
     """
     Format notification payload for PagerDuty Events API v2.
 
@@ -427,26 +795,16 @@ def format_pagerduty_payload(service_name: str, old_status: str, new_status: str
         PagerDuty Events API v2 payload
     """
     # Determine severity and event action
-    if new_status == "operational":
-        event_action = "resolve"
-        severity = "info"
-    elif new_status == "degraded":
-        event_action = "trigger"
-        severity = "warning"
-    else:  # down
-        event_action = "trigger"
-        severity = "critical"
+    event_action, severity = _PAGERDUTY_STYLE.get(new_status, _PAGERDUTY_STYLE["down"])
 
     # Build summary
-    operational_count = sum(1 for m in all_monitors if m['status'] == 'operational')
-    total_count = len(all_monitors)
+    counts = counts or build_counts(all_monitors, affected_monitors)
+    operational_count, total_count = counts.operational, counts.total
 
     if new_status == "operational":
         summary = f"{service_name} has recovered ({total_count}/{total_count} monitors operational)"
     else:
-        affected_text = ", ".join([m['name'] for m in affected_monitors[:3]])
-        if len(affected_monitors) > 3:
-            affected_text += f" (+{len(affected_monitors) - 3} more)"
+        affected_text = counts.affected_preview
         summary = f"{service_name} is {new_status.upper()}: {affected_text}"
 
     # Use service_id for dedup_key to group related alerts
@@ -467,7 +825,7 @@ def format_pagerduty_payload(service_name: str, old_status: str, new_status: str
                 "new_status": new_status,
                 "operational_monitors": operational_count,
                 "total_monitors": total_count,
-                "affected_monitors": [m['name'] for m in affected_monitors]
+                "affected_monitors": list(counts.affected_names)
             }
         }
     }
@@ -477,7 +835,8 @@ def format_pagerduty_payload(service_name: str, old_status: str, new_status: str
 
 def format_opsgenie_payload(service_name: str, old_status: str, new_status: str,
                             affected_monitors: List[dict], all_monitors: List[dict],
-                            timestamp: str, service_id: int = None) -> dict:
+                            timestamp: str, service_id: int = None,
+                            counts: StatusCounts = None) -> dict:
     """
     Format notification payload for Opsgenie Alert API.
 
@@ -495,18 +854,13 @@ def format_opsgenie_payload(service_name: str, old_status: str, new_status: str,
             "_opsgenie_action": "close",
             "alias": f"simplewatch-{service_id}" if service_id else f"simplewatch-{service_name}"
         }
-    elif new_status == "degraded":
-        priority = "P3"
-    else:  # down
-        priority = "P1"
+    priority = _OPSGENIE_PRIORITY.get(new_status, "P1")
 
     # Build message
-    operational_count = sum(1 for m in all_monitors if m['status'] == 'operational')
-    total_count = len(all_monitors)
+    counts = counts or build_counts(all_monitors, affected_monitors)
+    operational_count, total_count = counts.operational, counts.total
 
-    affected_text = ", ".join([m['name'] for m in affected_monitors[:3]])
-    if len(affected_monitors) > 3:
-        affected_text += f" (+{len(affected_monitors) - 3} more)"
+    affected_text = counts.affected_preview
 
     return {
         "message": f"{service_name} is {new_status.upper()}",
@@ -519,41 +873,34 @@ def format_opsgenie_payload(service_name: str, old_status: str, new_status: str,
             "service_name": service_name,
             "old_status": old_status,
             "new_status": new_status,
-            "affected_monitors": ", ".join([m['name'] for m in affected_monitors])
+            "affected_monitors": ", ".join(counts.affected_names)
         }
     }
 
 
 def format_teams_payload(service_name: str, old_status: str, new_status: str,
                          affected_monitors: List[dict], all_monitors: List[dict],
-                         timestamp: str) -> dict:
+                         timestamp: str, counts: StatusCounts = None) -> dict:
     """
     Format notification payload for Microsoft Teams (Adaptive Cards via Webhook).
 
     Returns:
         Teams Adaptive Card payload
     """
-    # Determine color and title
-    if new_status == "operational":
-        color = "good"  # Green
-        title = f"✅ {service_name} recovered"
-    elif new_status == "degraded":
-        color = "warning"  # Yellow
-        title = f"🟡 {service_name} is DEGRADED"
-    else:  # down
-        color = "attention"  # Red
-        title = f"🔴 {service_name} is DOWN"
+    # Determine title
+    emoji, _, state = _SLACK_STYLE.get(new_status, _SLACK_STYLE["down"])
+    title = f"{emoji} {service_name} {state}"
 
     # Count operational monitors
-    operational_count = sum(1 for m in all_monitors if m['status'] == 'operational')
-    total_count = len(all_monitors)
+    counts = counts or build_counts(all_monitors, affected_monitors)
+    operational_count, total_count = counts.operational, counts.total
 
     # Format affected monitors
     if affected_monitors:
-        affected_text = "\n".join([
+        affected_text = "\n".join(
             f"- {m['name']} ({m['type']}): {m.get('error', 'failed')}"
             for m in affected_monitors
-        ])
+        )
     else:
         affected_text = "All monitors recovered"
 
@@ -561,7 +908,7 @@ def format_teams_payload(service_name: str, old_status: str, new_status: str,
     return {
         "@type": "MessageCard",
         "@context": "http://schema.org/extensions",
-        "themeColor": "FF0000" if new_status == "down" else ("FFA500" if new_status == "degraded" else "00FF00"),
+        "themeColor": _TEAMS_THEME_COLOR.get(new_status, "00FF00"),
         "summary": title,
         "sections": [{
             "activityTitle": title,
@@ -578,7 +925,7 @@ def format_teams_payload(service_name: str, old_status: str, new_status: str,
 
 def format_telegram_payload(service_name: str, old_status: str, new_status: str,
                             affected_monitors: List[dict], all_monitors: List[dict],
-                            timestamp: str, chat_id: str) -> dict:
+                            timestamp: str, chat_id: str, counts: StatusCounts = None) -> dict:
     """
     Format notification payload for Telegram Bot API.
 
@@ -590,19 +937,11 @@ def format_telegram_payload(service_name: str, old_status: str, new_status: str,
         Telegram sendMessage payload
     """
     # Determine emoji
-    if new_status == "operational":
-        emoji = "✅"
-        status_text = "recovered"
-    elif new_status == "degraded":
-        emoji = "🟡"
-        status_text = "DEGRADED"
-    else:  # down
-        emoji = "🔴"
-        status_text = "DOWN"
+    emoji, status_text = _MESSAGE_STYLE.get(new_status, _MESSAGE_STYLE["down"])
 
     # Count operational monitors
-    operational_count = sum(1 for m in all_monitors if m['status'] == 'operational')
-    total_count = len(all_monitors)
+    counts = counts or build_counts(all_monitors, affected_monitors)
+    operational_count, total_count = counts.operational, counts.total
 
     # Format message with Markdown
     lines = [
@@ -614,7 +953,7 @@ def format_telegram_payload(service_name: str, old_status: str, new_status: str,
     if affected_monitors:
         lines.append("")
         lines.append("*Affected:*")
-        for m in affected_monitors[:5]:
+        for m in islice(affected_monitors, 5):
             error = m.get('error', 'failed')
             lines.append(f"  • {m['name']}: {error}")
         if len(affected_monitors) > 5:
@@ -632,7 +971,7 @@ def format_telegram_payload(service_name: str, old_status: str, new_status: str,
 
 def format_ntfy_payload(service_name: str, old_status: str, new_status: str,
                         affected_monitors: List[dict], all_monitors: List[dict],
-                        timestamp: str) -> dict:
+                        timestamp: str, counts: StatusCounts = None) -> dict:
     """
     Format notification for ntfy.sh (headers + body).
 
@@ -640,28 +979,16 @@ def format_ntfy_payload(service_name: str, old_status: str, new_status: str,
         Dict with 'headers' and 'body' keys for ntfy
     """
     # Determine priority and emoji
-    if new_status == "operational":
-        priority = "default"
-        emoji = "white_check_mark"
-        title = f"{service_name} recovered"
-    elif new_status == "degraded":
-        priority = "high"
-        emoji = "warning"
-        title = f"{service_name} is DEGRADED"
-    else:  # down
-        priority = "urgent"
-        emoji = "rotating_light"
-        title = f"{service_name} is DOWN"
+    priority, emoji, state = _NTFY_STYLE.get(new_status, _NTFY_STYLE["down"])
+    title = f"{service_name} {state}"
 
     # Count operational monitors
-    operational_count = sum(1 for m in all_monitors if m['status'] == 'operational')
-    total_count = len(all_monitors)
+    counts = counts or build_counts(all_monitors, affected_monitors)
+    operational_count, total_count = counts.operational, counts.total
 
     # Build message body
     if affected_monitors:
-        affected_text = ", ".join([m['name'] for m in affected_monitors[:3]])
-        if len(affected_monitors) > 3:
-            affected_text += f" (+{len(affected_monitors) - 3} more)"
+        affected_text = counts.affected_preview
         body = f"Affected: {affected_text}\nStatus: {operational_count}/{total_count} operational"
     else:
         body = f"All {total_count} monitors operational"
@@ -678,7 +1005,7 @@ def format_ntfy_payload(service_name: str, old_status: str, new_status: str,
 
 def format_matrix_payload(service_name: str, old_status: str, new_status: str,
                           affected_monitors: List[dict], all_monitors: List[dict],
-                          timestamp: str) -> dict:
+                          timestamp: str, counts: StatusCounts = None) -> dict:
     """
     Format notification payload for Matrix (m.room.message).
 
@@ -686,41 +1013,29 @@ def format_matrix_payload(service_name: str, old_status: str, new_status: str,
         Matrix message event payload
     """
     # Determine emoji
-    if new_status == "operational":
-        emoji = "✅"
-        status_text = "recovered"
-    elif new_status == "degraded":
-        emoji = "🟡"
-        status_text = "DEGRADED"
-    else:  # down
-        emoji = "🔴"
-        status_text = "DOWN"
+    emoji, status_text = _MESSAGE_STYLE.get(new_status, _MESSAGE_STYLE["down"])
 
     # Count operational monitors
-    operational_count = sum(1 for m in all_monitors if m['status'] == 'operational')
-    total_count = len(all_monitors)
+    counts = counts or build_counts(all_monitors, affected_monitors)
+    operational_count, total_count = counts.operational, counts.total
 
-    # Plain text version
+    # Plain text and HTML versions, built in one pass over the affected monitors
     plain_lines = [
         f"{emoji} {service_name} is {status_text}",
         f"Status: {operational_count}/{total_count} monitors operational"
     ]
-
-    if affected_monitors:
-        plain_lines.append("Affected:")
-        for m in affected_monitors[:5]:
-            plain_lines.append(f"  - {m['name']}: {m.get('error', 'failed')}")
-
-    # HTML version
     html_lines = [
         f"<h4>{emoji} {service_name} is {status_text}</h4>",
         f"<p><strong>Status:</strong> {operational_count}/{total_count} monitors operational</p>"
     ]
 
     if affected_monitors:
+        plain_lines.append("Affected:")
         html_lines.append("<p><strong>Affected:</strong></p><ul>")
-        for m in affected_monitors[:5]:
-            html_lines.append(f"<li>{m['name']}: {m.get('error', 'failed')}</li>")
+        for m in islice(affected_monitors, 5):
+            error = m.get('error', 'failed')
+            plain_lines.append(f"  - {m['name']}: {error}")
+            html_lines.append(f"<li>{m['name']}: {error}</li>")
         html_lines.append("</ul>")
 
     return {
@@ -731,9 +1046,42 @@ def format_matrix_payload(service_name: str, old_status: str, new_status: str,
     }
 
 
+# Variables supported in generic webhook templates (see format_generic_payload)
+_GENERIC_TEMPLATE_VARIABLES = frozenset({
+    "service_name", "old_status", "new_status", "status_emoji", "affected_count",
+    "operational_count", "total_count", "timestamp", "affected_monitors", "all_monitors"
+})
+_TEMPLATE_VARIABLE_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
+@lru_cache(maxsize=128)
+def _compile_generic_template(template: str) -> tuple:
+    """
+    Split a generic webhook template into (literal, variable_name) segments.
+    Templates are reused across notifications, so this runs once per template.
+    Unknown {{names}} are kept as literal text.
+
+    Returns:
+        Tuple of (segments, variables used); the last segment's variable is None
+    """
+    segments = []
+    used = set()
+    position = 0
+    for match in _TEMPLATE_VARIABLE_RE.finditer(template):
+        name = match.group(1)
+        if name not in _GENERIC_TEMPLATE_VARIABLES:
+            continue
+        segments.append((template[position:match.start()], name))
+        used.add(name)
+        position = match.end()
+    segments.append((template[position:], None))
+    return tuple(segments), frozenset(used)
+
+
 def format_generic_payload(template: str, service_name: str, old_status: str,
                            new_status: str, affected_monitors: List[dict],
-                           all_monitors: List[dict], timestamp: str) -> dict:
+                           all_monitors: List[dict], timestamp: str,
+                           counts: StatusCounts = None) -> dict:
     """
     Format notification payload using custom JSON template.
 
@@ -756,30 +1104,42 @@ def format_generic_payload(template: str, service_name: str, old_status: str,
     Returns:
         Parsed JSON payload dict
     """
-    # Determine emoji
-    emoji_map = {
-        "operational": "✅",
-        "degraded": "🟡",
-        "down": "🔴"
-    }
-
-    # Replace template variables
+    # Static templates (no {{variables}}) are parsed as-is
     payload_str = template
-    payload_str = payload_str.replace("{{service_name}}", service_name)
-    payload_str = payload_str.replace("{{old_status}}", old_status)
-    payload_str = payload_str.replace("{{new_status}}", new_status)
-    payload_str = payload_str.replace("{{status_emoji}}", emoji_map.get(new_status, "❓"))
-    payload_str = payload_str.replace("{{affected_count}}", str(len(affected_monitors)))
-    payload_str = payload_str.replace("{{operational_count}}",
-                                     str(sum(1 for m in all_monitors if m['status'] == 'operational')))
-    payload_str = payload_str.replace("{{total_count}}", str(len(all_monitors)))
-    payload_str = payload_str.replace("{{timestamp}}", timestamp)
-    payload_str = payload_str.replace("{{affected_monitors}}", json.dumps(affected_monitors))
-    payload_str = payload_str.replace("{{all_monitors}}", json.dumps(all_monitors))
+    if "{{" in template:
+        # Only compute the variables this template actually uses
+        segments, used = _compile_generic_template(template)
+        values = {}
+        if "service_name" in used:
+            values["service_name"] = service_name
+        if "old_status" in used:
+            values["old_status"] = old_status
+        if "new_status" in used:
+            values["new_status"] = new_status
+        if "status_emoji" in used:
+            values["status_emoji"] = _STATUS_EMOJI.get(new_status, "❓")
+        if "affected_count" in used:
+            values["affected_count"] = str(len(affected_monitors))
+        if "operational_count" in used or "total_count" in used:
+            counts = counts or build_counts(all_monitors, affected_monitors)
+            values["operational_count"] = str(counts.operational)
+            values["total_count"] = str(counts.total)
+        if "timestamp" in used:
+            values["timestamp"] = timestamp
+        if "affected_monitors" in used:
+            values["affected_monitors"] = fastjson.dumps(affected_monitors)
+        if "all_monitors" in used:
+            values["all_monitors"] = fastjson.dumps(all_monitors)
+
+        # Render in a single pass over the pre-split template
+        payload_str = "".join(
+            literal + values[name] if name else literal
+            for literal, name in segments
+        )
 
     # Parse and return
     try:
-        return json.loads(payload_str)
+        return fastjson.loads(payload_str)
     except json.JSONDecodeError as e:
         logger.error(f"Failed to parse generic payload template: {e}")
         raise
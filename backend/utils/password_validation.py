@@ -4,6 +4,8 @@ Centralized validation logic used across setup, user management, and password ch
 """
 from typing import Tuple
 
+_SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
 
 def validate_password(password: str) -> Tuple[bool, str]:
     """
@@ -28,13 +30,20 @@ def validate_password(password: str) -> Tuple[bool, str]:
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
 
-    # Check for uppercase letter
-    if not any(c.isupper() for c in password):
+    # Check for uppercase letter and special character in a single pass
+    has_upper = has_special = False
+    for c in password:
+        if not has_upper and c.isupper():
+            has_upper = True
+        if not has_special and c in _SPECIAL_CHARS:
+            has_special = True
+        if has_upper and has_special:
+            break
+
+    if not has_upper:
         return False, "Password must contain at least one uppercase letter"
 
-    # Check for special character
-    special_chars = "!@#$%^&*()_+-=[]{}|;:,.<>?"
-    if not any(c in special_chars for c in password):
+    if not has_special:
         return False, "Password must contain at least one special character"
 
     return True, ""
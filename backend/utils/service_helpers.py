@@ -2,31 +2,68 @@
 Service-level helper functions for status calculation, incident management, and notifications.
 Consolidates all service-related operations in one place.
 """
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from database import (
-    Service, Monitor, StatusUpdate, Incident,
-    SMTPConfig, NotificationChannel, ServiceNotificationSettings, NotificationLog,
-    AISettings, SQLALCHEMY_DATABASE_URL
+    Service, StatusUpdate, Incident,
+    NotificationChannel, ServiceNotificationSettings, NotificationLog,
+    AISettings, SessionLocal, SQLALCHEMY_DATABASE_URL
 )
 from api.maintenance import is_service_in_maintenance
 from monitors import HEARTBEAT_MONITORS
-from utils.service_status import get_service_current_status
+from utils.service_status import (
+    calculate_service_status_from_counts, get_latest_monitor_statuses, get_monitor_status_snapshot
+)
 from utils.notifications import (
-    send_email_with_config, send_webhook_with_payload,
+    send_email_with_config, send_webhook_with_payload, encode_json_payload, get_tested_smtp_config,
     format_slack_payload, format_discord_payload, format_generic_payload,
     format_pagerduty_payload, format_opsgenie_payload, format_teams_payload,
     format_telegram_payload, format_ntfy_payload, format_matrix_payload,
-    send_pagerduty, send_opsgenie, send_telegram, send_ntfy, send_matrix
+    send_pagerduty, send_opsgenie, send_telegram, send_ntfy, send_matrix,
+    build_counts
 )
 from datetime import datetime, timedelta
-from typing import List
-import json
+from typing import Any, Callable, Dict, List, Tuple
+from utils import fastjson
 import logging
 import asyncio
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import partial
+from io import StringIO
 
 logger = logging.getLogger(__name__)
 
+# Shared worker pool for notification sends (email and channels), created once
+# per process instead of spinning up threads for every status change
+_NOTIFY_MAX_WORKERS = 16
+_DISPATCH_POOL = ThreadPoolExecutor(max_workers=_NOTIFY_MAX_WORKERS, thread_name_prefix="notify")
+
+# Default window for coalescing status changes of a service into one notification,
+# for settings without their own debounce_seconds
+_NOTIFY_DEBOUNCE_SECONDS = 5
+# service_id -> (timer, old_status, new_status) of the notification waiting to be sent
+_pending_notifications: Dict[int, Tuple[threading.Timer, str, str]] = {}
+_pending_lock = threading.Lock()
+
+
+def dispatch_all(tasks: List[Callable[[], Any]]) -> List[Future]:
+    """
+    Run notification send callables in parallel on the shared dispatch pool.
+
+    Each send is network-bound, so total latency is the slowest destination
+    instead of the sum. Tasks must not touch the DB session.
+
+    Args:
+        tasks: Zero-argument callables
+
+    Returns:
+        Completed futures, in task order
+    """
+    futures = [_DISPATCH_POOL.submit(task) for task in tasks]
+    wait(futures)
+    return futures
+
 
 def trigger_ai_analysis_background(db_url: str, incident_id: int):
     """
@@ -87,12 +124,62 @@ def trigger_ai_analysis_background(db_url: str, incident_id: int):
 # Service Status Calculation
 # ============================================
 
+# Key in Session.info holding per-service monitor snapshots for the current
+# notification/incident pass
+_SNAPSHOT_CACHE_KEY = "svc_status_cache"
+
+
+def _memoized_snapshot(db: Session, service_id: int, kind: str, loader) -> List:
+    """Return loader(db, service_id), memoized on the session per (service_id, kind)."""
+    cache = db.info.setdefault(_SNAPSHOT_CACHE_KEY, {})
+    key = (service_id, kind)
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = cache[key] = loader(db, service_id)
+    return snapshot
+
+
+def get_monitor_statuses(db: Session, service_id: int) -> List:
+    """
+    Get (id, status) of each active monitor of a service, memoized on the session.
+
+    Status calculation and failing IDs run after every check, so they read this
+    narrow query; the wider get_monitor_snapshot() is only needed to notify.
+
+    Returns: Rows from get_latest_monitor_statuses()
+    """
+    return _memoized_snapshot(db, service_id, "statuses", get_latest_monitor_statuses)
+
+
+def get_monitor_snapshot(db: Session, service_id: int) -> List:
+    """
+    Get the latest-status-per-monitor snapshot of a service, memoized on the session.
+
+    Affected monitors and the monitors summary both read from this snapshot,
+    so one notification pass queries it only once.
+    Call invalidate_monitor_snapshot() once new status updates are committed.
+
+    Returns: Rows from get_monitor_status_snapshot()
+    """
+    return _memoized_snapshot(db, service_id, "snapshot", get_monitor_status_snapshot)
+
+
+def invalidate_monitor_snapshot(db: Session, service_id: int):
+    """Drop the memoized monitor snapshots of a service from the session."""
+    cache = db.info.get(_SNAPSHOT_CACHE_KEY, {})
+    cache.pop((service_id, "statuses"), None)
+    cache.pop((service_id, "snapshot"), None)
+
+
 def calculate_service_status(db: Session, service_id: int) -> str:
     """
     Calculate overall service status by aggregating monitor statuses.
     Returns: 'operational', 'degraded', 'down', or 'unknown'
     """
-    return get_service_current_status(db, service_id)["status"]
+    statuses = [row.status for row in get_monitor_statuses(db, service_id)]
+    return calculate_service_status_from_counts(
+        statuses.count("operational"), statuses.count("degraded"), statuses.count("down")
+    )
 
 
 def get_failing_monitor_ids(db: Session, service_id: int) -> List[int]:
@@ -102,21 +189,11 @@ def get_failing_monitor_ids(db: Session, service_id: int) -> List[int]:
 
     Returns: List of monitor IDs
     """
-    monitors = db.query(Monitor).filter(
-        Monitor.service_id == service_id,
-        Monitor.is_active == True
-    ).all()
-
-    failing = []
-    for monitor in monitors:
-        latest = db.query(StatusUpdate).filter(
-            StatusUpdate.monitor_id == monitor.id
-        ).order_by(StatusUpdate.timestamp.desc()).first()
-
-        if latest and latest.status in ["degraded", "down"]:
-            failing.append(monitor.id)
-
-    return failing
+    return [
+        row.id
+        for row in get_monitor_statuses(db, service_id)
+        if row.status in ["degraded", "down"]
+    ]
 
 
 # ============================================
@@ -134,6 +211,7 @@ def update_service_incidents(db: Session, service_id: int):
     - Closing incidents when service recovers
     """
     try:
+        now = datetime.utcnow()
         # Calculate current aggregated service status
         current_status = calculate_service_status(db, service_id)
 
@@ -150,10 +228,10 @@ def update_service_incidents(db: Session, service_id: int):
                 affected = get_failing_monitor_ids(db, service_id)
                 incident = Incident(
                     service_id=service_id,
-                    started_at=datetime.utcnow(),
+                    started_at=now,
                     severity=current_status,
                     status="ongoing",
-                    affected_monitors_json=json.dumps(affected)
+                    affected_monitors_json=fastjson.dumps(affected)
                 )
                 db.add(incident)
                 db.commit()
@@ -166,17 +244,17 @@ def update_service_incidents(db: Session, service_id: int):
                 ongoing.severity = current_status
                 # Update affected monitors
                 affected = get_failing_monitor_ids(db, service_id)
-                ongoing.affected_monitors_json = json.dumps(affected)
+                ongoing.affected_monitors_json = fastjson.dumps(affected)
                 db.commit()
                 logger.info(f"Updated incident {ongoing.id} severity to {current_status}")
 
         elif current_status == "operational":
             if ongoing:
                 # Service recovered - close incident
-                ongoing.ended_at = datetime.utcnow()
+                ongoing.ended_at = now
                 ongoing.status = "resolved"
                 ongoing.duration_seconds = int((ongoing.ended_at - ongoing.started_at).total_seconds())
-                ongoing.recovery_metadata_json = json.dumps({"trigger": "auto"})
+                ongoing.recovery_metadata_json = fastjson.dumps({"trigger": "auto"})
                 db.commit()
                 logger.info(f"Resolved incident {ongoing.id} (duration: {ongoing.duration_seconds}s)")
 
@@ -189,7 +267,8 @@ def update_service_incidents(db: Session, service_id: int):
 # Notification Helper Functions
 # ============================================
 
-def should_send_notification(db: Session, service_id: int, new_status: str) -> bool:
+def should_send_notification(db: Session, service_id: int, new_status: str,
+                             settings: ServiceNotificationSettings = None) -> bool:
     """
     Check if notification should be sent based on:
     1. Service is not in maintenance mode
@@ -197,6 +276,8 @@ def should_send_notification(db: Session, service_id: int, new_status: str) -> b
     3. Status actually changed
     4. Cooldown period elapsed (except for recovery)
 
+    Pass settings if already loaded to skip re-querying them.
+
     Returns: True if should notify
     """
     # Check if service is in maintenance - suppress all notifications during maintenance
@@ -204,9 +285,10 @@ def should_send_notification(db: Session, service_id: int, new_status: str) -> b
         logger.info(f"Skipping notification for service {service_id} - in maintenance window")
         return False
 
-    settings = db.query(ServiceNotificationSettings).filter(
-        ServiceNotificationSettings.service_id == service_id
-    ).first()
+    if settings is None:
+        settings = db.query(ServiceNotificationSettings).filter(
+            ServiceNotificationSettings.service_id == service_id
+        ).first()
 
     if not settings or not settings.enabled:
         return False
@@ -238,25 +320,16 @@ def get_affected_monitors(db: Session, service_id: int) -> List[dict]:
     """
     cutoff_time = datetime.utcnow() - timedelta(minutes=2)
 
-    monitors = db.query(Monitor).filter(
-        Monitor.service_id == service_id,
-        Monitor.is_active == True
-    ).all()
-
     affected = []
-    for monitor in monitors:
-        latest = db.query(StatusUpdate).filter(
-            StatusUpdate.monitor_id == monitor.id,
-            StatusUpdate.timestamp >= cutoff_time
-        ).order_by(StatusUpdate.timestamp.desc()).first()
-
-        if latest and latest.status != "operational":
-            config = json.loads(monitor.config_json)
-            metadata = json.loads(latest.metadata_json or "{}")
+    for row in get_monitor_snapshot(db, service_id):
+        # The latest update overall is the latest one since the cutoff, if any
+        if row.timestamp is not None and row.timestamp >= cutoff_time and row.status != "operational":
+            config = fastjson.loads(row.config_json)
+            metadata = fastjson.loads(row.metadata_json or "{}")
             affected.append({
-                "name": config.get("name", f"{monitor.monitor_type.title()} Monitor"),
-                "type": monitor.monitor_type,
-                "status": latest.status,
+                "name": config.get("name", f"{row.monitor_type.title()} Monitor"),
+                "type": row.monitor_type,
+                "status": row.status,
                 "error": metadata.get("reason") or metadata.get("error", "Unknown error")
             })
 
@@ -269,90 +342,230 @@ def get_all_monitors_summary(db: Session, service_id: int) -> List[dict]:
 
     Returns: List of dicts with monitor status
     """
-    monitors = db.query(Monitor).filter(
-        Monitor.service_id == service_id,
-        Monitor.is_active == True
-    ).all()
-
     summary = []
-    for monitor in monitors:
-        latest = db.query(StatusUpdate).filter(
-            StatusUpdate.monitor_id == monitor.id
-        ).order_by(StatusUpdate.timestamp.desc()).first()
-
-        config = json.loads(monitor.config_json)
+    for row in get_monitor_snapshot(db, service_id):
+        config = fastjson.loads(row.config_json)
         summary.append({
-            "name": config.get("name", f"{monitor.monitor_type.title()} Monitor"),
-            "type": monitor.monitor_type,
-            "status": latest.status if latest else "unknown",
-            "response_time": latest.response_time_ms if latest else None
+            "name": config.get("name", f"{row.monitor_type.title()} Monitor"),
+            "type": row.monitor_type,
+            "status": row.status or "unknown",
+            "response_time": row.response_time_ms
         })
 
     return summary
 
 
+# Email text pieces that don't depend on the notification
+_EMAIL_STATUS_EMOJI = {"operational": "✅", "degraded": "🟡", "down": "🔴"}
+_EMAIL_SEPARATOR = "━" * 36
+_EMAIL_STATUS_SUFFIX = {"degraded": " (DEGRADED)", "down": " (DOWN)"}
+
+
 def format_email_body(service_name: str, old_status: str, new_status: str,
                       affected_monitors: List[dict], all_monitors: List[dict],
                       timestamp: str, dashboard_url: str = None) -> str:
     """
     Format email body with service status details.
     """
-    # Status emoji
-    emoji_map = {"operational": "✅", "degraded": "🟡", "down": "🔴"}
-    emoji = emoji_map.get(new_status, "❓")
+    emoji = _EMAIL_STATUS_EMOJI.get(new_status, "❓")
+    body = StringIO()
+    write = body.write
 
     # Header
-    body = f"""Service: {service_name}
-Current Status: {emoji} {new_status.upper()} (was {old_status})
-Changed At: {timestamp}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-"""
+    write(f"Service: {service_name}\n"
+          f"Current Status: {emoji} {new_status.upper()} (was {old_status})\n"
+          f"Changed At: {timestamp}\n\n"
+          f"{_EMAIL_SEPARATOR}\n\n")
 
     # Affected monitors section
     if affected_monitors:
-        body += "AFFECTED MONITORS:\n\n"
+        write("AFFECTED MONITORS:\n\n")
         for monitor in affected_monitors:
-            body += f"❌ {monitor['name']} ({monitor['type']})\n"
-            body += f"   Status: {monitor['status'].upper()}\n"
-            body += f"   Error: {monitor['error']}\n\n"
-        body += "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
+            write(f"❌ {monitor['name']} ({monitor['type']})\n"
+                  f"   Status: {monitor['status'].upper()}\n"
+                  f"   Error: {monitor['error']}\n\n")
+        write(f"{_EMAIL_SEPARATOR}\n\n")
 
     # All monitors summary
-    body += "ALL MONITORS FOR THIS SERVICE:\n\n"
+    write("ALL MONITORS FOR THIS SERVICE:\n\n")
     operational_count = 0
     for monitor in all_monitors:
-        status_icon = "✅" if monitor['status'] == "operational" else "❌"
         if monitor['status'] == "operational":
             operational_count += 1
+            status_icon = "✅"
+        else:
+            status_icon = "❌"
 
         response_info = f" ({monitor['response_time']}ms)" if monitor['response_time'] else ""
-        body += f"{status_icon} {monitor['name']} - {monitor['status']}{response_info}\n"
+        write(f"{status_icon} {monitor['name']} - {monitor['status']}{response_info}\n")
 
-    body += f"\nService is {operational_count}/{len(all_monitors)} monitors operational"
-
-    if new_status == "degraded":
-        body += " (DEGRADED)"
-    elif new_status == "down":
-        body += " (DOWN)"
-
-    body += "\n\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
+    write(f"\nService is {operational_count}/{len(all_monitors)} monitors operational"
+          f"{_EMAIL_STATUS_SUFFIX.get(new_status, '')}\n\n{_EMAIL_SEPARATOR}\n\n")
 
     # Footer
     if dashboard_url:
-        body += f"View Dashboard: {dashboard_url}\n\n"
+        write(f"View Dashboard: {dashboard_url}\n\n")
+
+    write(f"""You're receiving this because email notifications are enabled for "{service_name}".
+To change notification settings, visit the dashboard and edit this service.""")
+
+    return body.getvalue()
 
-    body += f"""You're receiving this because email notifications are enabled for "{service_name}".
-To change notification settings, visit the dashboard and edit this service."""
 
+def _shared_payload(payload_cache, key, format_fn, *args, **kwargs) -> bytes:
+    """
+    Format and encode a webhook payload once per fan-out.
+
+    Slack, Discord, Teams and generic payloads depend only on the status change
+    (and template), so channels of the same kind can send the same encoded body.
+    """
+    body = payload_cache.get(key) if payload_cache is not None else None
+    if body is None:
+        body = encode_json_payload(format_fn(*args, **kwargs))
+        if payload_cache is not None:
+            payload_cache[key] = body
     return body
 
 
+def send_to_channel(channel, service_id: int, service_name: str, old_status: str, new_status: str,
+                    affected_monitors: List[dict], all_monitors: List[dict], timestamp: str,
+                    counts=None, payload_cache: dict = None):
+    """
+    Format and send a status change notification to a single channel.
+    Runs on a worker thread, so it must not touch the DB session.
+    counts is the shared build_counts() result for this status change, and
+    payload_cache a dict shared by all channels of the same fan-out.
+
+    Returns: (success, error) tuple, or None for an unknown channel type
+    """
+    success = False
+    error = None
+
+    if channel.channel_type == "slack":
+        payload = _shared_payload(
+            payload_cache, "slack", format_slack_payload,
+            service_name, old_status, new_status,
+            affected_monitors, all_monitors, timestamp,
+            counts=counts
+        )
+        success, error = send_webhook_with_payload(
+            channel.webhook_url, payload, channel.secret_token
+        )
+
+    elif channel.channel_type == "discord":
+        payload = _shared_payload(
+            payload_cache, "discord", format_discord_payload,
+            service_name, old_status, new_status,
+            affected_monitors, all_monitors, timestamp,
+            counts=counts
+        )
+        success, error = send_webhook_with_payload(
+            channel.webhook_url, payload, channel.secret_token
+        )
+
+    elif channel.channel_type == "teams":
+        payload = _shared_payload(
+            payload_cache, "teams", format_teams_payload,
+            service_name, old_status, new_status,
+            affected_monitors, all_monitors, timestamp,
+            counts=counts
+        )
+        success, error = send_webhook_with_payload(
+            channel.webhook_url, payload
+        )
+
+    elif channel.channel_type == "pagerduty":
+        # secret_token holds the routing key
+        payload = format_pagerduty_payload(
+            service_name, old_status, new_status,
+            affected_monitors, all_monitors, timestamp,
+            routing_key=channel.secret_token,
+            service_id=service_id,
+            counts=counts
+        )
+        success, error = send_pagerduty(channel.secret_token, payload)
+
+    elif channel.channel_type == "opsgenie":
+        # secret_token holds the API key
+        payload = format_opsgenie_payload(
+            service_name, old_status, new_status,
+            affected_monitors, all_monitors, timestamp,
+            service_id=service_id,
+            counts=counts
+        )
+        success, error = send_opsgenie(channel.secret_token, payload)
+
+    elif channel.channel_type == "telegram":
+        # webhook_url format: chat_id (e.g., "-1001234567890")
+        # secret_token holds the bot token
+        payload = format_telegram_payload(
+            service_name, old_status, new_status,
+            affected_monitors, all_monitors, timestamp,
+            chat_id=channel.webhook_url,
+            counts=counts
+        )
+        success, error = send_telegram(channel.secret_token, payload)
+
+    elif channel.channel_type == "ntfy":
+        # webhook_url is the full ntfy URL (e.g., https://ntfy.sh/mytopic)
+        # secret_token is optional access token for private topics
+        payload = format_ntfy_payload(
+            service_name, old_status, new_status,
+            affected_monitors, all_monitors, timestamp,
+            counts=counts
+        )
+        success, error = send_ntfy(
+            channel.webhook_url, payload, channel.secret_token
+        )
+
+    elif channel.channel_type == "matrix":
+        # webhook_url format: "homeserver|room_id" (e.g., "https://matrix.org|!roomid:matrix.org")
+        # secret_token holds the access token
+        parts = channel.webhook_url.split("|", 1)
+        if len(parts) == 2:
+            homeserver, room_id = parts
+            payload = format_matrix_payload(
+                service_name, old_status, new_status,
+                affected_monitors, all_monitors, timestamp,
+                counts=counts
+            )
+            success, error = send_matrix(
+                homeserver, room_id, channel.secret_token, payload
+            )
+        else:
+            error = "Invalid Matrix config format (expected 'homeserver|room_id')"
+
+    elif channel.channel_type == "generic":
+        payload = _shared_payload(
+            payload_cache, ("generic", channel.custom_payload_template), format_generic_payload,
+            channel.custom_payload_template,
+            service_name, old_status, new_status,
+            affected_monitors, all_monitors, timestamp,
+            counts=counts
+        )
+        success, error = send_webhook_with_payload(
+            channel.webhook_url, payload, channel.secret_token
+        )
+
+    else:
+        return None
+
+    return success, error
+
+
 # ============================================
 # Main Notification Function
 # ============================================
 
+def _record_notified_status(db: Session, service_id: int, new_status: str, now: datetime):
+    """Store the notified status and time with one UPDATE (committed by the caller)."""
+    db.execute(
+        update(ServiceNotificationSettings)
+        .where(ServiceNotificationSettings.service_id == service_id)
+        .values(last_notification_sent_at=now, last_notified_status=new_status)
+    )
+
+
 def send_service_notification(db: Session, service_id: int, old_status: str, new_status: str):
     """
     Main function to send notifications for a service status change.
@@ -360,247 +573,262 @@ def send_service_notification(db: Session, service_id: int, old_status: str, new
     This is called from scheduler.py and monitor_ingestion.py after status updates.
     Handles email and webhook notifications with proper logging.
     """
-    # Get service
-    service = db.query(Service).filter(Service.id == service_id).first()
-    if not service:
+    # One timestamp for the change, its delivery logs and the tracking update
+    now = datetime.utcnow()
+
+    # Get service and its notification settings in one query
+    row = db.query(Service, ServiceNotificationSettings).outerjoin(
+        ServiceNotificationSettings, ServiceNotificationSettings.service_id == Service.id
+    ).filter(Service.id == service_id).first()
+    if not row:
         logger.error(f"Service {service_id} not found")
         return
 
+    service, settings = row
+    if not settings:
+        return
+
     # Check if we should notify
-    if not should_send_notification(db, service_id, new_status):
+    if not should_send_notification(db, service_id, new_status, settings):
         return
 
-    # Get notification settings
-    settings = db.query(ServiceNotificationSettings).filter(
-        ServiceNotificationSettings.service_id == service_id
-    ).first()
+    # Resolve destinations first so nothing is gathered when nobody is listening
+    smtp_config = None
+    if settings.email_enabled and settings.email_recipient_list:
+        smtp_config = get_tested_smtp_config(db)
 
-    if not settings:
+    # Load webhook channels if enabled
+    channels = []
+    if settings.channel_ids:
+        channel_ids = fastjson.loads(settings.channel_ids)
+        if channel_ids:
+            channels = db.query(NotificationChannel).filter(
+                NotificationChannel.id.in_(channel_ids),
+                NotificationChannel.is_active == True,
+                NotificationChannel.is_tested == True
+            ).all()
+
+    if not smtp_config and not channels:
+        _record_notified_status(db, service_id, new_status, now)
+        db.commit()
+        logger.info(f"No notification destinations for service {service.name}: {old_status} → {new_status}")
         return
 
     # Gather monitor data
     affected_monitors = get_affected_monitors(db, service_id)
     all_monitors = get_all_monitors_summary(db, service_id)
     # ISO 8601 format for Discord compatibility
-    timestamp = datetime.utcnow().isoformat() + "Z"
-
-    # Send email if enabled
-    if settings.email_enabled and settings.email_recipients:
-        smtp_config = db.query(SMTPConfig).first()
-        if smtp_config and smtp_config.is_tested:
-            # Format subject
-            emoji = {"operational": "✅", "degraded": "🟡", "down": "🔴"}.get(new_status, "❓")
-            subject = f"{emoji} [SimpleWatch] {service.name} is {new_status.upper()}"
-
-            # Format body
-            body = format_email_body(
-                service.name, old_status, new_status,
-                affected_monitors, all_monitors, timestamp
-            )
-
-            # Send
-            recipients = [email.strip() for email in settings.email_recipients.split(",")]
-            success, error = send_email_with_config(
-                {
-                    'host': smtp_config.host,
-                    'port': smtp_config.port,
-                    'username': smtp_config.username,
-                    'password_encrypted': smtp_config.password_encrypted,
-                    'from_address': smtp_config.from_address,
-                    'use_tls': smtp_config.use_tls
-                },
-                recipients,
-                subject,
-                body
+    timestamp = now.isoformat() + "Z"
+
+    # Prepare email if enabled (DB reads stay on this thread)
+    email_job = None
+    if smtp_config:
+        # Format subject
+        emoji = _EMAIL_STATUS_EMOJI.get(new_status, "❓")
+        subject = f"{emoji} [SimpleWatch] {service.name} is {new_status.upper()}"
+
+        # Format body
+        body = format_email_body(
+            service.name, old_status, new_status,
+            affected_monitors, all_monitors, timestamp
+        )
+
+        recipients = settings.email_recipient_list
+        email_job = (smtp_config, recipients, subject, body)
+
+    # Fan out email and channel sends in parallel; DB writes stay on this thread
+    tasks = []
+    if email_job:
+        tasks.append(partial(send_email_with_config, *email_job))
+    if channels:
+        counts = build_counts(all_monitors, affected_monitors)
+        payload_cache = {}
+        tasks.extend(
+            partial(
+                send_to_channel, channel, service_id, service.name,
+                old_status, new_status, affected_monitors, all_monitors, timestamp,
+                counts, payload_cache
             )
-
-            # Log email notification
-            log_entry = NotificationLog(
+            for channel in channels
+        )
+
+    futures = dispatch_all(tasks)
+    email_future = futures.pop(0) if email_job else None
+
+    # Delivery logs are committed together with the tracking update below
+    log_entries = []
+
+    if email_future:
+        recipients = email_job[1]
+        success, error = email_future.result()
+
+        # Log email notification
+        log_entries.append(NotificationLog(
+            service_id=service_id,
+            notification_type='email',
+            channel_id=None,
+            channel_label=", ".join(recipients),
+            status_change=f"{old_status} -> {new_status}",
+            delivery_status='sent' if success else 'failed',
+            error_message=error if not success else None,
+            sent_at=now
+        ))
+
+        if success:
+            logger.info(f"Email notification sent for service {service.name}")
+        else:
+            logger.error(f"Failed to send email for service {service.name}: {error}")
+
+    for channel, future in zip(channels, futures):
+        try:
+            result = future.result()
+            if result is None:
+                logger.error(f"Unknown channel type: {channel.channel_type}")
+                continue
+            success, error = result
+
+            # Log webhook notification
+            log_entries.append(NotificationLog(
                 service_id=service_id,
-                notification_type='email',
-                channel_id=None,
-                channel_label=", ".join(recipients),
+                notification_type='webhook',
+                channel_id=channel.id,
+                channel_label=channel.label,
                 status_change=f"{old_status} -> {new_status}",
                 delivery_status='sent' if success else 'failed',
                 error_message=error if not success else None,
-                sent_at=datetime.utcnow()
-            )
-            db.add(log_entry)
-            db.commit()
+                sent_at=now
+            ))
 
             if success:
-                logger.info(f"Email notification sent for service {service.name}")
+                logger.info(f"Webhook notification sent to {channel.label}")
             else:
-                logger.error(f"Failed to send email for service {service.name}: {error}")
-
-    # Send webhooks if enabled
-    if settings.channel_ids:
-        channel_ids = json.loads(settings.channel_ids)
-        channels = db.query(NotificationChannel).filter(
-            NotificationChannel.id.in_(channel_ids),
-            NotificationChannel.is_active == True,
-            NotificationChannel.is_tested == True
-        ).all()
-
-        for channel in channels:
-            try:
-                # Format and send based on channel type
-                success = False
-                error = None
-
-                if channel.channel_type == "slack":
-                    payload = format_slack_payload(
-                        service.name, old_status, new_status,
-                        affected_monitors, all_monitors, timestamp
-                    )
-                    success, error = send_webhook_with_payload(
-                        channel.webhook_url, payload, channel.secret_token
-                    )
-
-                elif channel.channel_type == "discord":
-                    payload = format_discord_payload(
-                        service.name, old_status, new_status,
-                        affected_monitors, all_monitors, timestamp
-                    )
-                    success, error = send_webhook_with_payload(
-                        channel.webhook_url, payload, channel.secret_token
-                    )
-
-                elif channel.channel_type == "teams":
-                    payload = format_teams_payload(
-                        service.name, old_status, new_status,
-                        affected_monitors, all_monitors, timestamp
-                    )
-                    success, error = send_webhook_with_payload(
-                        channel.webhook_url, payload
-                    )
-
-                elif channel.channel_type == "pagerduty":
-                    # secret_token holds the routing key
-                    payload = format_pagerduty_payload(
-                        service.name, old_status, new_status,
-                        affected_monitors, all_monitors, timestamp,
-                        routing_key=channel.secret_token,
-                        service_id=service_id
-                    )
-                    success, error = send_pagerduty(channel.secret_token, payload)
-
-                elif channel.channel_type == "opsgenie":
-                    # secret_token holds the API key
-                    payload = format_opsgenie_payload(
-                        service.name, old_status, new_status,
-                        affected_monitors, all_monitors, timestamp,
-                        service_id=service_id
-                    )
-                    success, error = send_opsgenie(channel.secret_token, payload)
-
-                elif channel.channel_type == "telegram":
-                    # webhook_url format: chat_id (e.g., "-1001234567890")
-                    # secret_token holds the bot token
-                    payload = format_telegram_payload(
-                        service.name, old_status, new_status,
-                        affected_monitors, all_monitors, timestamp,
-                        chat_id=channel.webhook_url
-                    )
-                    success, error = send_telegram(channel.secret_token, payload)
-
-                elif channel.channel_type == "ntfy":
-                    # webhook_url is the full ntfy URL (e.g., https://ntfy.sh/mytopic)
-                    # secret_token is optional access token for private topics
-                    payload = format_ntfy_payload(
-                        service.name, old_status, new_status,
-                        affected_monitors, all_monitors, timestamp
-                    )
-                    success, error = send_ntfy(
-                        channel.webhook_url, payload, channel.secret_token
-                    )
-
-                elif channel.channel_type == "matrix":
-                    # webhook_url format: "homeserver|room_id" (e.g., "https://matrix.org|!roomid:matrix.org")
-                    # secret_token holds the access token
-                    parts = channel.webhook_url.split("|", 1)
-                    if len(parts) == 2:
-                        homeserver, room_id = parts
-                        payload = format_matrix_payload(
-                            service.name, old_status, new_status,
-                            affected_monitors, all_monitors, timestamp
-                        )
-                        success, error = send_matrix(
-                            homeserver, room_id, channel.secret_token, payload
-                        )
-                    else:
-                        error = "Invalid Matrix config format (expected 'homeserver|room_id')"
-
-                elif channel.channel_type == "generic":
-                    payload = format_generic_payload(
-                        channel.custom_payload_template,
-                        service.name, old_status, new_status,
-                        affected_monitors, all_monitors, timestamp
-                    )
-                    success, error = send_webhook_with_payload(
-                        channel.webhook_url, payload, channel.secret_token
-                    )
-
-                else:
-                    logger.error(f"Unknown channel type: {channel.channel_type}")
-                    continue
-
-                # Log webhook notification
-                log_entry = NotificationLog(
-                    service_id=service_id,
-                    notification_type='webhook',
-                    channel_id=channel.id,
-                    channel_label=channel.label,
-                    status_change=f"{old_status} -> {new_status}",
-                    delivery_status='sent' if success else 'failed',
-                    error_message=error if not success else None,
-                    sent_at=datetime.utcnow()
-                )
-                db.add(log_entry)
-                db.commit()
+                logger.error(f"Failed to send webhook to {channel.label}: {error}")
 
-                if success:
-                    logger.info(f"Webhook notification sent to {channel.label}")
-                else:
-                    logger.error(f"Failed to send webhook to {channel.label}: {error}")
-
-            except Exception as e:
-                # Log failed webhook attempt
-                log_entry = NotificationLog(
-                    service_id=service_id,
-                    notification_type='webhook',
-                    channel_id=channel.id,
-                    channel_label=channel.label,
-                    status_change=f"{old_status} -> {new_status}",
-                    delivery_status='failed',
-                    error_message=str(e),
-                    sent_at=datetime.utcnow()
-                )
-                db.add(log_entry)
-                db.commit()
-                logger.error(f"Error sending webhook to {channel.label}: {e}")
+        except Exception as e:
+            # Log failed webhook attempt
+            log_entries.append(NotificationLog(
+                service_id=service_id,
+                notification_type='webhook',
+                channel_id=channel.id,
+                channel_label=channel.label,
+                status_change=f"{old_status} -> {new_status}",
+                delivery_status='failed',
+                error_message=str(e),
+                sent_at=now
+            ))
+            logger.error(f"Error sending webhook to {channel.label}: {e}")
 
     # Update notification tracking
-    settings.last_notification_sent_at = datetime.utcnow()
-    settings.last_notified_status = new_status
+    _record_notified_status(db, service_id, new_status, now)
+    db.add_all(log_entries)
     db.commit()
 
     logger.info(f"Notification process completed for service {service.name}: {old_status} → {new_status}")
 
 
-def notify_service_status_change(db: Session, service_id: int):
+def schedule_service_notification(service_id: int, old_status: str, new_status: str,
+                                  debounce_seconds: int = _NOTIFY_DEBOUNCE_SECONDS):
+    """
+    Debounce a service status change notification.
+
+    A change already pending for the service is replaced: its timer is cancelled
+    and the original old_status is kept, so a flap storm ends in one notification
+    with the final status. If the service flaps back to the status it started
+    from, nothing is sent.
+
+    Args:
+        service_id: ID of the service
+        old_status: Last notified status
+        new_status: Current service status
+        debounce_seconds: Coalescing window; 0 sends right away on the timer thread
+    """
+    with _pending_lock:
+        pending = _pending_notifications.get(service_id)
+        if pending:
+            # Same change already waiting; keep its timer so steady checks don't postpone it
+            if pending[2] == new_status:
+                return
+            timer, old_status, _ = _pending_notifications.pop(service_id)
+            timer.cancel()
+
+        if new_status == old_status:
+            return
+
+        timer = threading.Timer(debounce_seconds, _flush_service_notification, args=(service_id,))
+        timer.daemon = True
+        _pending_notifications[service_id] = (timer, old_status, new_status)
+        timer.start()
+
+
+def _flush_service_notification(service_id: int):
+    """Timer callback: send the coalesced notification with its own DB session."""
+    with _pending_lock:
+        pending = _pending_notifications.get(service_id)
+        # Rescheduled since this timer fired; the newer timer will send
+        if not pending or pending[0] is not threading.current_thread():
+            return
+        del _pending_notifications[service_id]
+
+    _send_pending_notification(service_id, pending)
+
+
+def flush_pending_notifications():
     """
-    Post-check helper: compare new vs last-notified status, send notification if changed,
-    and update incident records. Called after any StatusUpdate is committed.
+    Send every notification still waiting out its debounce window right away.
+    Called on shutdown, since the timers are daemon threads and would be dropped.
     """
-    new_status = calculate_service_status(db, service_id)
-    settings = db.query(ServiceNotificationSettings).filter(
-        ServiceNotificationSettings.service_id == service_id
-    ).first()
-    old_status = settings.last_notified_status if settings else "unknown"
-    if new_status != old_status:
+    with _pending_lock:
+        pending = dict(_pending_notifications)
+        _pending_notifications.clear()
+
+    for service_id, entry in pending.items():
+        entry[0].cancel()
+        _send_pending_notification(service_id, entry)
+
+    if pending:
+        logger.info(f"Flushed {len(pending)} pending notification(s)")
+
+
+def _send_pending_notification(service_id: int, pending: Tuple[threading.Timer, str, str]):
+    """Send a coalesced notification with its own DB session."""
+    _, old_status, new_status = pending
+    db = SessionLocal()
+    try:
         send_service_notification(db, service_id, old_status, new_status)
-    update_service_incidents(db, service_id)
+    except Exception as e:
+        logger.error(f"Error sending notification for service {service_id}: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+def notify_service_status_change(db: Session, service_id: int):
+    """
+    Post-check helper: compare new vs last-notified status, schedule a debounced
+    notification if changed, and update incident records. Called after any StatusUpdate is committed.
+    """
+    # A new status update was just committed; rebuild the snapshot once for this pass
+    invalidate_monitor_snapshot(db, service_id)
+    try:
+        new_status = calculate_service_status(db, service_id)
+        settings = db.query(ServiceNotificationSettings).filter(
+            ServiceNotificationSettings.service_id == service_id
+        ).first()
+        # Without enabled settings nothing would be sent, and last_notified_status
+        # never catches up, so don't start a timer on every check
+        if settings and settings.enabled:
+            # schedule_service_notification checks for a pending change and a
+            # real status change under the lock its timers use
+            debounce_seconds = settings.debounce_seconds
+            if debounce_seconds is None:
+                debounce_seconds = _NOTIFY_DEBOUNCE_SECONDS
+            schedule_service_notification(
+                service_id, settings.last_notified_status, new_status, debounce_seconds
+            )
+        update_service_incidents(db, service_id)
+    finally:
+        # Don't let a long-lived session serve this snapshot to a later check
+        invalidate_monitor_snapshot(db, service_id)
 
 
 def persist_monitor_check(db: Session, monitor, result: dict):
@@ -619,19 +847,20 @@ def persist_monitor_check(db: Session, monitor, result: dict):
     if result.get("message") and "reason" not in metadata:
         metadata["reason"] = result["message"]
 
+    now = datetime.utcnow()
     status_update = StatusUpdate(
         service_id=monitor.service_id,
         monitor_id=monitor.id,
         status=status,
-        timestamp=datetime.utcnow(),
+        timestamp=now,
         response_time_ms=response_time_ms,
-        metadata_json=json.dumps(metadata)
+        metadata_json=fastjson.dumps(metadata)
     )
     db.add(status_update)
 
     if monitor.monitor_type not in HEARTBEAT_MONITORS:
-        monitor.last_check_at = datetime.utcnow()
-    monitor.next_check_at = datetime.utcnow() + timedelta(minutes=monitor.check_interval_minutes)
+        monitor.last_check_at = now
+    monitor.next_check_at = now + timedelta(minutes=monitor.check_interval_minutes)
 
     db.commit()
 
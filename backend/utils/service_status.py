@@ -2,9 +2,10 @@
 Service status calculation utilities.
 Single source of truth for calculating aggregated service status from monitors.
 """
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from database import Monitor, StatusUpdate
-from typing import Dict, Optional
+from database import Monitor
+from typing import Dict, List, Optional
 
 
 def calculate_service_status_from_counts(operational: int, degraded: int, down: int) -> str:
@@ -25,68 +26,100 @@ def calculate_service_status_from_counts(operational: int, degraded: int, down:
     Returns:
         Overall status: 'operational', 'degraded', 'down', or 'unknown'
     """
-    total_monitors = operational + degraded + down
-
-    if total_monitors == 0:
-        return "unknown"
-    elif operational == total_monitors:
-        return "operational"
-    elif down == total_monitors:
+    # All operational is by far the most common case, so test it first
+    if degraded == 0 and down == 0:
+        return "operational" if operational else "unknown"
+    elif operational == 0 and degraded == 0:
         return "down"
     else:
         return "degraded"
 
 
-def get_service_current_status(db: Session, service_id: int) -> Dict:
+def get_latest_monitor_statuses(db: Session, service_id: int) -> List:
+    """
+    Get the latest status of every active monitor of a service.
+
+    Args:
+        db: Database session
+        service_id: ID of the service
+
+    Returns:
+        List of (id, status) rows ordered by monitor ID; status is None for
+        monitors without any status update
+    """
+    return db.query(
+        Monitor.id, Monitor.latest_status.label("status")
+    ).filter(
+        Monitor.service_id == service_id,
+        Monitor.is_active == True
+    ).order_by(Monitor.id).all()
+
+
+def get_monitor_status_snapshot(db: Session, service_id: int) -> List:
     """
-    Get the current aggregated status for a service based on its monitors.
+    Get every active monitor of a service with its latest status in one query.
+
+    Reads the latest_* columns kept on Monitor, so status_updates isn't touched.
 
     Args:
         db: Database session
         service_id: ID of the service
 
     Returns:
-        Dict with:
+        List of (id, monitor_type, config_json, status, response_time_ms,
+        metadata_json, timestamp) rows ordered by monitor ID; the status columns
+        are None for monitors without any status update
+    """
+    return db.query(
+        Monitor.id, Monitor.monitor_type, Monitor.config_json,
+        Monitor.latest_status.label("status"),
+        Monitor.latest_response_time_ms.label("response_time_ms"),
+        Monitor.latest_metadata_json.label("metadata_json"),
+        Monitor.latest_status_at.label("timestamp")
+    ).filter(
+        Monitor.service_id == service_id,
+        Monitor.is_active == True
+    ).order_by(Monitor.id).all()
+
+
+def get_services_current_status(db: Session, service_ids: List[int]) -> Dict[int, Dict]:
+    """
+    Get the current aggregated status of several services with one query.
+
+    Args:
+        db: Database session
+        service_ids: IDs of the services
+
+    Returns:
+        Dict of service ID -> dict with:
         - status: Overall service status ('operational', 'degraded', 'down', 'unknown')
         - latest_timestamp: Most recent status update timestamp
         - operational_count: Count of operational monitors
         - degraded_count: Count of degraded monitors
         - down_count: Count of down monitors
     """
-    monitors = db.query(Monitor).filter(
-        Monitor.service_id == service_id,
-        Monitor.is_active == True
-    ).all()
-
-    if not monitors:
-        return {
-            "status": "unknown",
-            "latest_timestamp": None,
-            "operational_count": 0,
-            "degraded_count": 0,
-            "down_count": 0
-        }
-
-    operational_count = 0
-    degraded_count = 0
-    down_count = 0
-    latest_timestamp = None
-
-    for monitor in monitors:
-        latest_status = db.query(StatusUpdate).filter(
-            StatusUpdate.monitor_id == monitor.id
-        ).order_by(StatusUpdate.timestamp.desc()).first()
-
-        if latest_status:
-            if latest_status.status == "operational":
-                operational_count += 1
-            elif latest_status.status == "degraded":
-                degraded_count += 1
-            elif latest_status.status == "down":
-                down_count += 1
-
-            if latest_timestamp is None or latest_status.timestamp > latest_timestamp:
-                latest_timestamp = latest_status.timestamp
+    rows = db.query(
+        Monitor.service_id, Monitor.latest_status, func.count(), func.max(Monitor.latest_status_at)
+    ).filter(
+        Monitor.service_id.in_(service_ids),
+        Monitor.is_active == True,
+        Monitor.latest_status.isnot(None)
+    ).group_by(Monitor.service_id, Monitor.latest_status).all()
+
+    groups = {service_id: [] for service_id in service_ids}
+    for service_id, status, count, latest in rows:
+        groups[service_id].append((status, count, latest))
+
+    return {service_id: _status_from_groups(service_rows) for service_id, service_rows in groups.items()}
+
+
+def _status_from_groups(rows) -> Dict:
+    """Build the current status dict from (status, count, max timestamp) groups."""
+    counts = {status: count for status, count, _ in rows}
+    operational_count = counts.get("operational", 0)
+    degraded_count = counts.get("degraded", 0)
+    down_count = counts.get("down", 0)
+    latest_timestamp = max((timestamp for _, _, timestamp in rows), default=None)
 
     overall_status = calculate_service_status_from_counts(
         operational_count, degraded_count, down_count
@@ -1,8 +1,9 @@
 """
 SLA calculation utilities for SimpleWatch.
 """
+from sqlalchemy import and_, case, func
 from sqlalchemy.orm import Session
-from database import Service
+from database import Monitor, Service
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 import logging
@@ -10,6 +11,9 @@ from utils.uptime import calculate_service_uptime_window
 
 logger = logging.getLogger(__name__)
 
+# Longest time a cached SLA is reused while its inputs are unchanged
+_SLA_MAX_REUSE = timedelta(hours=1)
+
 
 def update_sla_cache(db: Session):
     """
@@ -19,40 +23,61 @@ def update_sla_cache(db: Session):
     Args:
         db: Database session
     """
-    # Only get services with SLA configured
-    services = db.query(Service).filter(
+    # Only get services with SLA configured, with what their SLA depends on
+    services = db.query(
+        Service.id, Service.sla_target, Service.sla_timeframe_days,
+        Service.cached_sla_input_key, Service.cached_sla_updated_at,
+        func.max(Monitor.latest_status_changed_at), func.count(Monitor.id),
+        func.count(case((Monitor.latest_status != "operational", 1)))
+    ).outerjoin(
+        Monitor, and_(Monitor.service_id == Service.id, Monitor.is_active == True)
+    ).filter(
         Service.is_active == True,
         Service.sla_target.isnot(None),
         Service.sla_timeframe_days.isnot(None)
-    ).all()
+    ).group_by(Service.id).all()
 
     if not services:
         return
 
     logger.info(f"Updating SLA cache for {len(services)} services")
 
-    for service in services:
+    now = datetime.utcnow()
+    updates = []
+    skipped = 0
+    for (service_id, target, timeframe_days, cached_key, cached_at,
+         changed_at, monitor_count, non_operational) in services:
+        # Changes only on a monitor status transition or a config change, not on every check
+        input_key = f"{changed_at.isoformat() if changed_at else ''}|{monitor_count}|{target}|{timeframe_days}"
+
+        # Nothing changed since the last run and the service is up, so only the
+        # window edge moved; recompute at least every _SLA_MAX_REUSE for that.
+        # During an outage downtime keeps growing, so always recompute.
+        if (non_operational == 0 and cached_key == input_key
+                and cached_at and now - cached_at < _SLA_MAX_REUSE):
+            skipped += 1
+            continue
+
         try:
-            sla_data = calculate_service_sla(db, service.id)
-
-            if sla_data:
-                service.cached_sla_percentage = sla_data["percentage"]
-                service.cached_sla_status = sla_data["status"]
-                service.cached_sla_error_budget_seconds = sla_data["error_budget_seconds"]
-                service.cached_sla_updated_at = datetime.utcnow()
-            else:
-                # No SLA data available
-                service.cached_sla_percentage = None
-                service.cached_sla_status = None
-                service.cached_sla_error_budget_seconds = None
-                service.cached_sla_updated_at = datetime.utcnow()
+            # No SLA data available -> cached fields are cleared
+            sla_data = calculate_service_sla(db, service_id) or {}
+            updates.append({
+                "id": service_id,
+                "cached_sla_percentage": sla_data.get("percentage"),
+                "cached_sla_status": sla_data.get("status"),
+                "cached_sla_error_budget_seconds": sla_data.get("error_budget_seconds"),
+                "cached_sla_updated_at": now,
+                "cached_sla_input_key": input_key
+            })
 
         except Exception as e:
-            logger.error(f"Error updating SLA cache for service {service.id}: {e}")
+            logger.error(f"Error updating SLA cache for service {service_id}: {e}")
             continue
 
+    # One executemany UPDATE instead of per-instance dirty tracking
+    db.bulk_update_mappings(Service, updates)
     db.commit()
-    logger.info(f"SLA cache updated for {len(services)} services")
+    logger.info(f"SLA cache updated for {len(updates)} services ({skipped} unchanged)")
 
 
 def calculate_service_sla(db: Session, service_id: int) -> Optional[Dict]:
@@ -4,93 +4,271 @@ Uptime calculation utilities for SimpleWatch.
 from sqlalchemy.orm import Session
 from database import Service, StatusUpdate, Monitor
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from itertools import chain, groupby
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Tuple
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Short-lived memo of calculate_service_uptime_window results:
+# (service_id, cutoff minute) -> (monotonic time computed, uptime)
+_UPTIME_WINDOW_TTL_SECONDS = 60
+_UPTIME_WINDOW_CACHE_SIZE = 1024
+_uptime_window_cache: Dict[Tuple[int, datetime], Tuple[float, Optional[float]]] = {}
+_uptime_window_lock = threading.Lock()
+
 
 def update_uptime_cache(db: Session):
     """
     Update cached uptime data for all active services.
     Called by background job every 5 minutes to keep uptime data fresh.
 
+    Status updates of all services are read in one streamed query ordered by
+    service, instead of two or three queries per service.
+
     Args:
         db: Database session
     """
-    services = db.query(Service).filter(Service.is_active == True).all()
+    services = db.query(Service.id, Service.created_at).filter(Service.is_active == True).all()
 
     if not services:
         return
 
     logger.info(f"Updating uptime cache for {len(services)} services")
 
-    for service in services:
-        try:
-            uptime_data = calculate_service_uptime(db, service.id)
-
-            if uptime_data:
-                service.cached_uptime_percentage = uptime_data["percentage"]
-                service.cached_uptime_period_days = uptime_data["period_days"]
-                service.cached_uptime_period_label = uptime_data["period_label"]
-                service.cached_uptime_updated_at = datetime.utcnow()
-            else:
-                # No uptime data available (new service or no status updates)
-                service.cached_uptime_percentage = None
-                service.cached_uptime_period_days = None
-                service.cached_uptime_period_label = None
-                service.cached_uptime_updated_at = datetime.utcnow()
+    now = datetime.utcnow()
+    service_ids = [service.id for service in services]
 
-        except Exception as e:
-            logger.error(f"Error updating uptime cache for service {service.id}: {e}")
-            continue
+    monitor_ids = {}
+    for service_id, monitor_id in db.query(Monitor.service_id, Monitor.id).filter(
+        Monitor.service_id.in_(service_ids),
+        Monitor.is_active == True
+    ):
+        monitor_ids.setdefault(service_id, []).append(monitor_id)
+
+    periods = {
+        service.id: _uptime_period(service.created_at, now)
+        for service in services
+        if service.created_at and service.id in monitor_ids
+    }
 
+    uptimes = {}
+    if periods:
+        earliest_cutoff = min(cutoff_time for _, _, cutoff_time, _ in periods.values())
+        rows = db.query(
+            StatusUpdate.service_id, StatusUpdate.monitor_id, StatusUpdate.timestamp, StatusUpdate.status
+        ).join(
+            Monitor, Monitor.id == StatusUpdate.monitor_id
+        ).filter(
+            StatusUpdate.service_id.in_(list(periods)),
+            Monitor.service_id == StatusUpdate.service_id,
+            Monitor.is_active == True,
+            StatusUpdate.timestamp >= earliest_cutoff
+        ).order_by(StatusUpdate.service_id, StatusUpdate.timestamp).yield_per(1000)
+
+        for service_id, service_rows in groupby(rows, key=itemgetter(0)):
+            try:
+                period_days, period_label, cutoff_time, actual_period_seconds = periods[service_id]
+                percentage = _operational_percentage(
+                    ((mid, ts, status) for _, mid, ts, status in service_rows if ts >= cutoff_time),
+                    monitor_ids[service_id], cutoff_time, actual_period_seconds, now
+                )
+                if percentage is not None:
+                    uptimes[service_id] = {
+                        "percentage": percentage,
+                        "period_days": period_days,
+                        "period_label": period_label
+                    }
+            except Exception as e:
+                logger.error(f"Error updating uptime cache for service {service_id}: {e}")
+
+    # No uptime data available (new service or no status updates) -> cleared.
+    # One executemany UPDATE instead of per-instance dirty tracking
+    updates = []
+    for service in services:
+        uptime_data = uptimes.get(service.id, {})
+        updates.append({
+            "id": service.id,
+            "cached_uptime_percentage": uptime_data.get("percentage"),
+            "cached_uptime_period_days": uptime_data.get("period_days"),
+            "cached_uptime_period_label": uptime_data.get("period_label"),
+            "cached_uptime_updated_at": now
+        })
+    db.bulk_update_mappings(Service, updates)
     db.commit()
     logger.info(f"Uptime cache updated for {len(services)} services")
 
 
 def _accumulate_operational_seconds(
-    sorted_timestamps, timeline, monitor_status: dict,
-    previous_service_status: str, start_time: datetime
+    updates: Iterable, monitor_status: dict,
+    previous_service_status: str, start_time: datetime, now: datetime
 ) -> float:
     """
-    Walk a monitor-status timeline forward, accumulating seconds spent in operational state.
+    Walk (monitor_id, timestamp, status) updates ordered by timestamp, accumulating
+    seconds spent in operational state. Updates sharing a timestamp are applied together.
     Mutates monitor_status in place. Returns total operational seconds including tail to now.
     """
     operational_seconds = 0.0
     previous_time = start_time
 
-    for ts in sorted_timestamps:
+    # Running count of non-operational monitors, updated per change instead of
+    # recounting every monitor at every timestamp
+    total_monitors = len(monitor_status)
+    bad_count = sum(1 for s in monitor_status.values() if s != "operational")
+
+    for ts, group in groupby(updates, key=itemgetter(1)):
         duration = (ts - previous_time).total_seconds()
         if previous_service_status == "operational":
             operational_seconds += duration
 
-        for mid, status in timeline[ts].items():
+        for mid, _, status in group:
+            old_status = monitor_status.get(mid)
+            if old_status is None:
+                total_monitors += 1
+            else:
+                bad_count -= old_status != "operational"
+            bad_count += status != "operational"
             monitor_status[mid] = status
 
-        operational_count = sum(1 for s in monitor_status.values() if s == "operational")
-        total_monitors = len(monitor_status)
-        if operational_count == total_monitors:
+        if bad_count == 0:
             previous_service_status = "operational"
-        elif operational_count == 0:
+        elif bad_count == total_monitors:
             previous_service_status = "down"
         else:
             previous_service_status = "degraded"
 
         previous_time = ts
 
-    final_duration = (datetime.utcnow() - previous_time).total_seconds()
+    final_duration = (now - previous_time).total_seconds()
     if previous_service_status == "operational":
         operational_seconds += final_duration
 
     return operational_seconds
 
 
+def _uptime_period(created_at: datetime, now: datetime) -> Tuple[int, str, datetime, float]:
+    """
+    Pick the uptime period of a service: the last year, or since creation for
+    services younger than a year.
+
+    Returns: (period_days, period_label, cutoff_time, actual_period_seconds)
+    """
+    service_age_days = (now - created_at).days
+
+    if service_age_days >= 365:
+        period_days = 365
+        period_label = "1y"
+        # Use actual period (1 year from now)
+        cutoff_time = now - timedelta(days=365)
+        if created_at > cutoff_time:
+            cutoff_time = created_at
+            actual_period_seconds = (now - cutoff_time).total_seconds()
+        else:
+            actual_period_seconds = 365 * 86400
+    else:
+        # For services younger than 1 year, ALWAYS use since creation
+        period_days = max(service_age_days, 1)  # At least 1 day for display
+        period_label = f"{period_days}d"
+        cutoff_time = created_at
+        actual_period_seconds = (now - created_at).total_seconds()
+
+    return period_days, period_label, cutoff_time, actual_period_seconds
+
+
+def _single_monitor_operational_seconds(updates: Iterable, start_time: datetime,
+                                       now: datetime) -> Optional[float]:
+    """
+    Operational seconds for a single-monitor service, where the service state is
+    simply the monitor's state, so no timeline or per-monitor bookkeeping is needed.
+    The monitor is assumed operational at start_time.
+
+    Returns: Operational seconds up to now, or None if there are no updates
+    """
+    operational_seconds = 0.0
+    previous_time = start_time
+    operational = True
+    seen = False
+
+    for _, ts, status in updates:
+        if operational:
+            operational_seconds += (ts - previous_time).total_seconds()
+        operational = status == "operational"
+        previous_time = ts
+        seen = True
+
+    if not seen:
+        return None
+
+    if operational:
+        operational_seconds += (now - previous_time).total_seconds()
+    return operational_seconds
+
+
+def _operational_percentage(updates: Iterable, monitor_ids: List[int], cutoff_time: datetime,
+                            actual_period_seconds: float, now: datetime) -> Optional[float]:
+    """
+    Uptime percentage from (monitor_id, timestamp, status) updates ordered by timestamp.
+    All monitors are assumed operational at the start of the period.
+
+    Returns: Percentage rounded to one decimal, or None if there are no updates
+    """
+    if len(monitor_ids) == 1:
+        operational_seconds = _single_monitor_operational_seconds(updates, cutoff_time, now)
+        if operational_seconds is None:
+            return None
+        if actual_period_seconds > 0:
+            return round((operational_seconds / actual_period_seconds) * 100, 1)
+        return 100.0
+
+    updates = iter(updates)
+    first = next(updates, None)
+    if first is None:
+        return None
+
+    # All monitors assumed operational at start of period (no pre-seeding needed here)
+    monitor_status = {mid: "operational" for mid in monitor_ids}
+
+    operational_seconds = _accumulate_operational_seconds(
+        chain((first,), updates), monitor_status, "operational", cutoff_time, now
+    )
+
+    if actual_period_seconds > 0:
+        return round((operational_seconds / actual_period_seconds) * 100, 1)
+    return 100.0
+
+
+def _get_statuses_before(db: Session, monitor_ids: List[int], cutoff_time: datetime) -> List:
+    """
+    Get each monitor's last status before cutoff_time in one query.
+
+    Returns: List of (monitor_id, status) rows; status is None for monitors
+    without any update before the cutoff
+    """
+    last_status = (
+        db.query(StatusUpdate.status)
+        .filter(
+            StatusUpdate.monitor_id == Monitor.id,
+            StatusUpdate.timestamp < cutoff_time
+        )
+        .order_by(StatusUpdate.timestamp.desc())
+        .limit(1)
+        .correlate(Monitor)
+        .scalar_subquery()
+    )
+    return db.query(Monitor.id, last_status).filter(Monitor.id.in_(monitor_ids)).all()
+
+
 def calculate_service_uptime_window(db: Session, service_id: int, cutoff_time: datetime) -> Optional[float]:
     """
     Calculate uptime percentage for a service within a specific time window.
     Used by incidents page for time-filtered uptime stats.
 
+    Results are memoized per service and cutoff minute for _UPTIME_WINDOW_TTL_SECONDS,
+    so repeated page loads don't rescan the window.
+
     Args:
         db: Database session
         service_id: ID of the service
@@ -99,13 +277,40 @@ def calculate_service_uptime_window(db: Session, service_id: int, cutoff_time: d
     Returns:
         Uptime percentage (0-100) or None if no data available
     """
+    key = (service_id, cutoff_time.replace(second=0, microsecond=0))
+    now = time.monotonic()
+
+    with _uptime_window_lock:
+        cached = _uptime_window_cache.get(key)
+        if cached and now - cached[0] < _UPTIME_WINDOW_TTL_SECONDS:
+            return cached[1]
+
+    uptime = _compute_service_uptime_window(db, service_id, cutoff_time)
+
+    with _uptime_window_lock:
+        if len(_uptime_window_cache) >= _UPTIME_WINDOW_CACHE_SIZE:
+            # Drop expired entries; start over if everything is still fresh
+            for stale_key in [k for k, (at, _) in _uptime_window_cache.items()
+                              if now - at >= _UPTIME_WINDOW_TTL_SECONDS]:
+                del _uptime_window_cache[stale_key]
+            if len(_uptime_window_cache) >= _UPTIME_WINDOW_CACHE_SIZE:
+                _uptime_window_cache.clear()
+        _uptime_window_cache[key] = (now, uptime)
+
+    return uptime
+
+
+def _compute_service_uptime_window(db: Session, service_id: int, cutoff_time: datetime) -> Optional[float]:
+    """Uncached calculate_service_uptime_window()."""
+    now = datetime.utcnow()
+
     # Get all monitors for this service
-    monitors = db.query(Monitor).filter(
+    monitor_ids = [monitor_id for monitor_id, in db.query(Monitor.id).filter(
         Monitor.service_id == service_id,
         Monitor.is_active == True
-    ).all()
+    )]
 
-    if not monitors:
+    if not monitor_ids:
         return None
 
     # Get service to check creation date
@@ -117,39 +322,31 @@ def calculate_service_uptime_window(db: Session, service_id: int, cutoff_time: d
     # This prevents counting time before the service existed as "operational"
     actual_cutoff = max(cutoff_time, service.created_at)
 
-    # Get status updates for all monitors in the time window
-    monitor_ids = [m.id for m in monitors]
-    all_status_updates = db.query(StatusUpdate).filter(
+    # Stream the three columns the timeline needs instead of loading ORM objects
+    all_status_updates = db.query(
+        StatusUpdate.monitor_id, StatusUpdate.timestamp, StatusUpdate.status
+    ).filter(
         StatusUpdate.service_id == service_id,
         StatusUpdate.monitor_id.in_(monitor_ids),
         StatusUpdate.timestamp >= actual_cutoff
-    ).order_by(StatusUpdate.timestamp).all()
+    ).order_by(StatusUpdate.timestamp).yield_per(1000)
 
-    if not all_status_updates:
+    # Rows arrive in timestamp order and are consumed in one pass below
+    all_status_updates = iter(all_status_updates)
+    first = next(all_status_updates, None)
+    if first is None:
         return None
 
-    # Build timeline
-    timeline = {}
-    for update in all_status_updates:
-        ts = update.timestamp
-        if ts not in timeline:
-            timeline[ts] = {}
-        timeline[ts][update.monitor_id] = update.status
-
-    sorted_timestamps = sorted(timeline.keys())
-
     # Track current status for each monitor
-    # Initialize from last known status BEFORE actual_cutoff
-    monitor_status = {}
-    for mid in monitor_ids:
-        # Get last status update before actual_cutoff
-        last_status = db.query(StatusUpdate).filter(
-            StatusUpdate.monitor_id == mid,
-            StatusUpdate.timestamp < actual_cutoff
-        ).order_by(StatusUpdate.timestamp.desc()).first()
-
-        # If we have a status before cutoff, use it; otherwise assume operational
-        monitor_status[mid] = last_status.status if last_status else "operational"
+    # Initialize from last known status BEFORE actual_cutoff; otherwise assume operational.
+    # A window clamped to the service's creation has no earlier updates to look up.
+    if actual_cutoff == service.created_at:
+        monitor_status = {mid: "operational" for mid in monitor_ids}
+    else:
+        monitor_status = {
+            mid: status or "operational"
+            for mid, status in _get_statuses_before(db, monitor_ids, actual_cutoff)
+        }
 
     # Derive initial service status from seeded monitor statuses
     operational_count = sum(1 for s in monitor_status.values() if s == "operational")
@@ -162,106 +359,10 @@ def calculate_service_uptime_window(db: Session, service_id: int, cutoff_time: d
         initial_service_status = "degraded"
 
     operational_seconds = _accumulate_operational_seconds(
-        sorted_timestamps, timeline, monitor_status, initial_service_status, actual_cutoff
+        chain((first,), all_status_updates), monitor_status, initial_service_status, actual_cutoff, now
     )
 
-    total_seconds = (datetime.utcnow() - actual_cutoff).total_seconds()
+    total_seconds = (now - actual_cutoff).total_seconds()
     if total_seconds > 0:
         return round((operational_seconds / total_seconds) * 100, 1)
     return 100.0
-
-
-def calculate_service_uptime(db: Session, service_id: int) -> Optional[Dict]:
-    """
-    Calculate uptime percentage for a service.
-
-    Returns uptime for the last year (if service is > 1 year old) or since creation.
-    Only counts "operational" status as uptime.
-
-    Args:
-        db: Database session
-        service_id: ID of the service
-
-    Returns:
-        Dict with percentage and period_label, or None if no data
-        Example: {"percentage": 99.5, "period_days": 30, "period_label": "30d"}
-    """
-    # Get service
-    service = db.query(Service).filter(Service.id == service_id).first()
-    if not service or not service.created_at:
-        return None
-
-    # Determine time period
-    service_age = datetime.utcnow() - service.created_at
-    service_age_days = service_age.days
-
-    if service_age_days >= 365:
-        period_days = 365
-        period_label = "1y"
-        # Use actual period (1 year from now)
-        cutoff_time = datetime.utcnow() - timedelta(days=365)
-        if service.created_at > cutoff_time:
-            cutoff_time = service.created_at
-            actual_period_seconds = (datetime.utcnow() - cutoff_time).total_seconds()
-        else:
-            actual_period_seconds = 365 * 86400
-    else:
-        # For services younger than 1 year, ALWAYS use since creation
-        period_days = max(service_age_days, 1)  # At least 1 day for display
-        period_label = f"{period_days}d"
-        cutoff_time = service.created_at
-        actual_period_seconds = (datetime.utcnow() - service.created_at).total_seconds()
-
-    # Get all monitors for this service
-    monitors = db.query(Monitor).filter(
-        Monitor.service_id == service_id,
-        Monitor.is_active == True
-    ).all()
-
-    if not monitors:
-        return None
-
-    # Get status updates for all monitors in the period (in one query)
-    monitor_ids = [m.id for m in monitors]
-    all_status_updates = db.query(StatusUpdate).filter(
-        StatusUpdate.service_id == service_id,
-        StatusUpdate.monitor_id.in_(monitor_ids),
-        StatusUpdate.timestamp >= cutoff_time
-    ).order_by(StatusUpdate.timestamp).all()
-
-    if not all_status_updates:
-        # No status updates in period - service never initialized
-        # Return None so frontend can display "N/A" or hide uptime
-        logger.info(f"Service {service_id}: No status updates, returning None")
-        return None
-
-    # Build timeline of all monitor status changes
-    # Group updates by timestamp for efficient processing
-    timeline = {}
-    for update in all_status_updates:
-        ts = update.timestamp
-        if ts not in timeline:
-            timeline[ts] = {}
-        timeline[ts][update.monitor_id] = update.status
-
-    # Sort timestamps
-    sorted_timestamps = sorted(timeline.keys())
-
-    # All monitors assumed operational at start of period (no pre-seeding needed here)
-    monitor_status = {mid: "operational" for mid in monitor_ids}
-
-    operational_seconds = _accumulate_operational_seconds(
-        sorted_timestamps, timeline, monitor_status, "operational", cutoff_time
-    )
-
-    if actual_period_seconds > 0:
-        uptime_percentage = round((operational_seconds / actual_period_seconds) * 100, 1)
-    else:
-        uptime_percentage = 100.0
-
-    return {
-        "percentage": uptime_percentage,
-        "period_days": period_days,
-        "period_label": period_label
-    }
-
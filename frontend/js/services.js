@@ -310,6 +310,7 @@ async function loadNotificationSettingsForService(serviceId) {
             document.getElementById('editEmailEnabled').checked = settings.email_enabled;
             document.getElementById('editEmailRecipients').value = settings.email_recipients || '';
             document.getElementById('editCooldownMinutes').value = settings.cooldown_minutes;
+            document.getElementById('editDebounceSeconds').value = settings.debounce_seconds ?? 5;
             document.getElementById('editNotifyOnRecovery').checked = settings.notify_on_recovery;
 
             // Show/hide email recipients group
@@ -343,6 +344,7 @@ async function loadNotificationSettingsForService(serviceId) {
             document.getElementById('editEmailEnabled').checked = false;
             document.getElementById('editEmailRecipients').value = '';
             document.getElementById('editCooldownMinutes').value = 5;
+            document.getElementById('editDebounceSeconds').value = 5;
             document.getElementById('editNotifyOnRecovery').checked = true;
             document.getElementById('emailRecipientsGroup').style.display = 'none';
         }
@@ -423,6 +425,7 @@ document.addEventListener('DOMContentLoaded', () => {
                     email_recipients: document.getElementById('editEmailRecipients').value || null,
                     channel_ids: selectedChannelIds.length > 0 ? JSON.stringify(selectedChannelIds.map(Number)) : null,
                     cooldown_minutes: parseInt(document.getElementById('editCooldownMinutes').value),
+                    debounce_seconds: parseInt(document.getElementById('editDebounceSeconds').value),
                     notify_on_recovery: document.getElementById('editNotifyOnRecovery').checked
                 })
             });